@@ -10,6 +10,9 @@ st.markdown(
 
 1. 랜덤 좌석 배치표 만들기  
 2. 번호순(시험용) 좌석 배치표 만들기  
+3. 여러 반 좌석 배치표 한 번에 만들기  
+4. 한 학기 자리 바꾸기 계획 (여러 회차) 한 번에 만들기  
+5. 시험실 좌석 배치 (학년 전체를 여러 시험실에) 만들기  
 
 를 할 수 있는 멀티 페이지 앱입니다.
 
@@ -0,0 +1,272 @@
+"""배치 엔진 / HTML / PDF 성능 측정 (Streamlit 없이).
+
+예시::
+
+    python -m benchmarks.run                  # 측정하고 baseline.json 과 비교
+    python -m benchmarks.run --quick          # 1,000명 이하만
+    python -m benchmarks.run --save-baseline  # 지금 결과를 기준값으로 저장
+    python -m benchmarks.run --only pdf -o bench_output.txt
+
+합성 명단(30명 ~ 5,000명)과 화면 최대(10줄 x 10분단)보다 큰 격자까지 돌려서
+경과 시간(중앙값), 최대 메모리(tracemalloc), 결과 크기(PDF bytes / HTML 글자 수)를 잰다.
+캐시는 반복마다 비워서 처음 만드는 경우를 재고, "(캐시)" 항목만 캐시에 있는 경우를 잰다.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from seating.cache import CHART_CACHE, FIT_CACHE, PAGE_CACHE, PDF_CACHE
+from seating.engines import assign_seats_by_number, assign_seats_random
+from seating.fonts import load_korean_font
+from seating.render import html as html_render
+from seating.render.html import render_chart
+from seating.render.pdf import make_pdf, make_pdf_both
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+
+# (이름, 학생 수, 줄, 분단, 좌석 형태)
+SCENARIOS = [
+    ("30명 6x5", 30, 6, 5, "Single"),
+    ("40명 짝 6x4", 40, 6, 4, "Paired"),
+    ("100명 10x10", 100, 10, 10, "Single"),
+    ("200명 짝 10x10 (화면 최대)", 200, 10, 10, "Paired"),
+    ("1000명 25x40", 1000, 25, 40, "Single"),
+    ("5000명 50x100", 5000, 50, 100, "Single"),
+]
+QUICK_MAX_STUDENTS = 1000
+MIN_DELTA_SECONDS = 0.002  # 이보다 작은 차이는 측정 잡음으로 보고 느려짐/빨라짐을 표시하지 않는다
+
+_FAMILY = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "남궁", "황보"]
+_GIVEN = ["민준", "서연", "도윤", "하은", "시우", "지유", "예준", "수아", "해바라기", "가"]
+
+
+# =========================================================
+# 1. 합성 명단
+# =========================================================
+def synthetic_roster(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    family = rng.choice(_FAMILY, n)
+    given = rng.choice(_GIVEN, n)
+    return pd.DataFrame(
+        {
+            "출석 번호": [str(i) for i in range(1, n + 1)],
+            "이름": [f + g for f, g in zip(family, given)],
+            "성별": rng.choice(["남", "여"], n),
+        }
+    )
+
+
+def clear_caches():
+    for cache in (PDF_CACHE, PAGE_CACHE, FIT_CACHE, CHART_CACHE, html_render._CELL_CACHE):
+        cache.clear()
+
+
+# 디스크 보관함은 쓰지 않는다: 처음 만드는 시간을 재야 하고, 합성 명단 결과로 보관함을 채우지 않는다.
+for _cache in (PDF_CACHE, CHART_CACHE):
+    _cache.disk = None
+
+
+# =========================================================
+# 2. 측정 항목
+# =========================================================
+def _cases(df, rows, bun_dan, mode):
+    # (항목 이름, 매번 캐시를 비울지, 실행 함수) — 실행 함수는 크기를 잴 결과를 돌려준다.
+    matrix = assign_seats_random(df, rows, bun_dan, mode, seed=1)
+    number_cols = bun_dan * 2 if mode == "Paired" else bun_dan
+    return [
+        ("assign_seats_random", True, lambda: assign_seats_random(df, rows, bun_dan, mode, seed=1)),
+        ("assign_seats_by_number", True, lambda: assign_seats_by_number(df, rows, number_cols, "asc", "left")),
+        ("render_chart", True, lambda: render_chart(matrix, mode)),
+        ("make_pdf", True, lambda: make_pdf(matrix, mode, "teacher", bun_dan, "교사용 좌석 배치표")),
+        ("make_pdf_both", True, lambda: make_pdf_both(matrix, mode, bun_dan)),
+        ("make_pdf_both (캐시)", False, lambda: make_pdf_both(matrix, mode, bun_dan)),
+    ]
+
+
+def _size(result):
+    if isinstance(result, (bytes, str)):
+        return len(result)
+    return None
+
+
+def measure(func, cold: bool, repeat: int):
+    times = []
+    result = None
+    if not cold:
+        func()  # 캐시 채우기
+    for _ in range(repeat):
+        if cold:
+            clear_caches()
+        gc.collect()
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+
+    # 메모리는 따로 한 번 (tracemalloc 이 시간 측정을 느리게 하므로)
+    if cold:
+        clear_caches()
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "seconds": statistics.median(times),
+        "min_seconds": min(times),
+        "peak_bytes": peak,
+        "output_bytes": _size(result),
+    }
+
+
+def run_benchmarks(scenarios, repeat: int = 5, only=None, log=None):
+    load_korean_font()  # 폰트 파싱은 서버에서도 프로세스당 한 번이라 측정에서 뺀다
+    results = {}
+    for name, n, rows, bun_dan, mode in scenarios:
+        df = synthetic_roster(n)
+        for case, cold, func in _cases(df, rows, bun_dan, mode):
+            if only and not any(word in case for word in only):
+                continue
+            # 큰 명단의 PDF 는 한 번이 오래 걸리므로 반복 횟수를 줄인다.
+            times = repeat if n <= QUICK_MAX_STUDENTS or "pdf" not in case else max(1, repeat // 2)
+            row = measure(func, cold, times)
+            results[f"{name} | {case}"] = row
+            if log:
+                log(f"{name:28} {case:24} {row['seconds'] * 1000:9.1f} ms")
+    return results
+
+
+# =========================================================
+# 3. 기준값 저장 / 비교
+# =========================================================
+def environment():
+    import reportlab
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "reportlab": reportlab.Version,
+    }
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"environment": environment(), "results": results}, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def load_baseline(path=BASELINE_PATH):
+    if not os.path.isfile(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _fmt_bytes(n):
+    if n is None:
+        return "-"
+    for unit in ("B", "KB", "MB"):
+        if n < 1024 or unit == "MB":
+            return f"{n:.0f}{unit}" if unit == "B" else f"{n:.1f}{unit}"
+        n /= 1024
+
+
+def _ratio(new, old):
+    if not old or new is None:
+        return None
+    return new / old
+
+
+def compare(results, baseline, tolerance: float = 0.2):
+    # 줄 목록과 느려진 항목 목록을 돌려준다. tolerance: 이만큼(비율) 넘게 느려지면 표시
+    old_results = (baseline or {}).get("results", {})
+    lines = [
+        f"{'항목':56} {'시간':>10} {'기준':>10} {'배율':>6} {'최대 메모리':>12} {'결과 크기':>10}",
+        "-" * 110,
+    ]
+    regressions = []
+    for key, row in results.items():
+        old = old_results.get(key)
+        ratio = _ratio(row["seconds"], old["seconds"]) if old else None
+        mark = ""
+        if old and abs(row["seconds"] - old["seconds"]) < MIN_DELTA_SECONDS:
+            pass
+        elif ratio is not None and ratio > 1 + tolerance:
+            mark = "  ▲ 느려짐"
+            regressions.append(key)
+        elif ratio is not None and ratio < 1 - tolerance:
+            mark = "  ▼ 빨라짐"
+        old_ms = f"{old['seconds'] * 1000:8.1f}ms" if old else "-"
+        ratio_text = f"{ratio:5.2f}x" if ratio is not None else "-"
+        lines.append(
+            f"{key:56} {row['seconds'] * 1000:8.1f}ms {old_ms:>10} {ratio_text:>6} "
+            f"{_fmt_bytes(row['peak_bytes']):>12} {_fmt_bytes(row['output_bytes']):>10}{mark}"
+        )
+    if baseline:
+        env = baseline.get("environment", {})
+        lines.append("")
+        lines.append(f"기준값 환경: Python {env.get('python')}, CPU {env.get('cpu_count')}개, {env.get('platform')}")
+    return lines, regressions
+
+
+# =========================================================
+# 4. 명령줄
+# =========================================================
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="배치 엔진 / HTML / PDF 성능을 재고 기준값과 비교합니다.",
+    )
+    parser.add_argument("--quick", action="store_true", help=f"{QUICK_MAX_STUDENTS:,}명 이하 시나리오만")
+    parser.add_argument("--repeat", type=int, default=5, help="항목마다 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--only", nargs="+", default=None, help="이름에 이 단어가 들어간 항목만 (예: pdf assign)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="기준값 파일 (JSON)")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준값으로 저장")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="느려짐으로 표시할 배율 (0.2 = 20%%)")
+    parser.add_argument(
+        "--fail-on-regression", action="store_true", help="느려진 항목이 있으면 종료 코드 1"
+    )
+    parser.add_argument("-o", "--output", default=None, help="비교 보고서를 저장할 파일")
+    return parser
+
+
+def _log(line):
+    print(line, file=sys.stderr, flush=True)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    scenarios = [s for s in SCENARIOS if not args.quick or s[1] <= QUICK_MAX_STUDENTS]
+    results = run_benchmarks(scenarios, args.repeat, args.only, _log)
+    baseline = load_baseline(args.baseline)
+    lines, regressions = compare(results, baseline, args.tolerance)
+    if baseline is None and not args.save_baseline:
+        lines += ["", "기준값이 없습니다. --save-baseline 으로 저장하세요."]
+    report = "\n".join(lines)
+    print(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"\n기준값 저장: {args.baseline}")
+    return 1 if args.fail_on_regression and regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+import streamlit as st
+
+from seating.batch import assign_all, cached_class_rosters, render_merged_pdf, render_zip
+from seating.engines import LayoutOptions
+
+# =========================================================
+# Streamlit UI (여러 반 좌석 배치를 한 번에)
+# =========================================================
+st.set_page_config(page_title="여러 반 한 번에", layout="centered")
+
+st.title("🏫 여러 반 좌석 배치표 한 번에 만들기")
+
+st.markdown(
+    """
+### 1️⃣ 엑셀 업로드
+
+- 반마다 **시트를 하나씩** 만든 엑셀 파일 1개, 또는
+- 반마다 **엑셀 파일을 하나씩** 여러 개 올려 주세요.
+
+각 시트의 형식은 다른 페이지와 같습니다: `출석 번호 | 이름 | 성별`
+시트가 여러 개면 **시트 이름**, 파일이 여러 개면 **파일 이름**이 반 이름이 됩니다.
+"""
+)
+
+uploaded_files = st.file_uploader(
+    "명단 파일 업로드 (.xlsx / .csv / .tsv, 여러 개 가능)", type=["xlsx", "csv", "tsv"], accept_multiple_files=True
+)
+
+if uploaded_files:
+    files = [(f.name, f.getvalue()) for f in uploaded_files]
+    classes = cached_class_rosters(st.session_state, files)
+
+    good = [cls for cls in classes if cls.ok]
+    for cls in classes:
+        if not cls.ok:
+            st.warning(f"⚠️ {cls.name}: {cls.error}")
+    st.success(f"✅ {len(good)}개 반의 명단을 불러왔습니다.")
+
+    st.markdown("---")
+    st.subheader("2️⃣ 배치 옵션")
+
+    engine = st.radio(
+        "배치 방식",
+        ["random", "number"],
+        format_func=lambda x: "랜덤 배치" if x == "random" else "번호순 배치 (시험용)",
+        horizontal=True,
+    )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        if engine == "random":
+            seating_mode = st.radio(
+                "좌석 형태",
+                ["Single", "Paired"],
+                format_func=lambda x: "혼자 앉기" if x == "Single" else "짝으로 앉기",
+            )
+            sort_order, start_side = "asc", "left"
+        else:
+            seating_mode = "Single"
+            sort_option = st.selectbox(
+                "정렬 기준", ["번호 낮은순 → 높은순", "번호 높은순 → 낮은순"]
+            )
+            sort_order = "asc" if "낮은순" in sort_option else "desc"
+            start_side_option = st.selectbox(
+                "시작 위치", ["왼쪽 앞에서부터", "오른쪽 앞에서부터"]
+            )
+            start_side = "left" if "왼쪽" in start_side_option else "right"
+    with col2:
+        bun_dan = st.number_input(
+            "분단 수",
+            min_value=2,
+            max_value=10,
+            value=5 if seating_mode == "Paired" else 4,
+        )
+        rows = st.number_input("줄 수(행)", min_value=2, max_value=10, value=6)
+
+    output = st.radio(
+        "받을 형식",
+        ["pdf", "zip"],
+        format_func=lambda x: "PDF 한 파일로 합치기" if x == "pdf" else "반별 PDF 묶음 (ZIP)",
+        horizontal=True,
+    )
+
+    if st.button("🏫 전체 반 좌석 배치 생성", type="primary", disabled=not good):
+        options = LayoutOptions(
+            engine=engine,
+            rows=int(rows),
+            bun_dan=int(bun_dan),
+            seating_mode=seating_mode,
+            sort_order=sort_order,
+            start_side=start_side,
+        )
+
+        with st.spinner("좌석 배치표를 만드는 중입니다..."):
+            assign_all(good, options)
+            done = [cls for cls in good if cls.matrix is not None]
+            for cls in good:
+                if cls.matrix is None:
+                    st.error(f"⚠️ {cls.name}: {cls.error}")
+
+            if done:
+                if output == "pdf":
+                    data = render_merged_pdf(done, options)
+                    file_name, mime = f"{engine}_seating_all.pdf", "application/pdf"
+                else:
+                    data = render_zip(done, options)
+                    file_name, mime = f"{engine}_seating_all.zip", "application/zip"
+
+        if done:
+            st.markdown("---")
+            st.subheader("3️⃣ 다운로드")
+            st.caption(", ".join(cls.name for cls in done))
+            st.download_button(
+                f"📥 {len(done)}개 반 좌석 배치표",
+                data,
+                file_name=file_name,
+                mime=mime,
+                on_click="ignore",
+            )
+else:
+    st.info("엑셀 파일을 업로드하면 여러 반 좌석 배치를 시작할 수 있습니다 😊")
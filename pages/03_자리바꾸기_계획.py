@@ -0,0 +1,104 @@
+import pandas as pd
+import streamlit as st
+
+from seating.cache import content_key, deferred, new_session_pdf_cache
+from seating.render.html import HTML_STYLE
+from seating.roster import cached_roster_digest
+from seating.rotation import plan_rotations, render_plan_pdf
+from seating.ui import roster_input_section, show_chart
+
+# =========================================================
+# Streamlit UI (한 학기 자리 바꾸기 계획)
+# =========================================================
+st.set_page_config(page_title="자리 바꾸기 계획", layout="centered")
+st.markdown(HTML_STYLE, unsafe_allow_html=True)
+
+st.title("🔄 한 학기 자리 바꾸기 계획")
+
+st.markdown(
+    """
+### 1️⃣ 명단 올리기
+
+랜덤 좌석 배치와 같은 형식(`출석 번호 | 이름 | 성별`)의 엑셀·CSV 를 올리거나 붙여 넣으면
+여러 회차의 자리표를 **한 번에** 만듭니다.
+회차마다 **이전에 짝이었던 학생끼리는 다시 짝이 되지 않도록** 배치합니다.
+"""
+)
+
+df = roster_input_section()
+
+if df is not None:
+    st.success(f"✅ 학생 {len(df)}명의 명단을 불러왔습니다.")
+    roster_id = cached_roster_digest(st.session_state)
+
+    st.markdown("---")
+    st.subheader("2️⃣ 계획 설정")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        seating_mode = st.radio(
+            "좌석 형태",
+            ["Single", "Paired"],
+            format_func=lambda x: "혼자 앉기" if x == "Single" else "짝으로 앉기",
+        )
+        count = st.number_input("회차 수 (예: 한 달에 한 번이면 4~5)", min_value=2, max_value=12, value=4)
+    with col2:
+        bun_dan = st.number_input(
+            "분단 수",
+            min_value=2,
+            max_value=10,
+            value=5 if seating_mode == "Paired" else 4,
+        )
+        rows = st.number_input("줄 수(행)", min_value=2, max_value=10, value=6)
+
+    cols = int(bun_dan) * 2 if seating_mode == "Paired" else int(bun_dan)
+    total_seats = int(rows) * cols
+
+    if st.button("🔄 자리 바꾸기 계획 만들기", type="primary"):
+        if total_seats < len(df):
+            st.error("⚠️ 좌석이 부족해요!")
+            st.warning(f"학생 {len(df)}명 / 자리 {total_seats}석")
+        else:
+            with st.spinner("회차별 자리표를 계산하는 중입니다..."):
+                plan = plan_rotations(df, int(rows), int(bun_dan), seating_mode, int(count))
+            st.session_state["rotation_plan"] = (roster_id, plan)
+
+    saved = st.session_state.get("rotation_plan")
+    if saved and saved[0] == roster_id:
+        plan = saved[1]
+
+        st.markdown("---")
+        st.subheader("3️⃣ 회차별 자리표")
+        st.dataframe(
+            pd.DataFrame(
+                {
+                    "회차": plan.labels,
+                    "이전 회차와 같은 짝": plan.repeats,
+                }
+            ),
+            hide_index=True,
+        )
+
+        for tab, matrix in zip(st.tabs(plan.labels), plan.matrices):
+            with tab:
+                show_chart(matrix, plan.seating_mode)
+
+        st.markdown("---")
+        st.subheader("4️⃣ PDF 다운로드")
+        st.caption(f"시드 {plan.seed}")
+
+        if "pdf_cache" not in st.session_state:
+            st.session_state["pdf_cache"] = new_session_pdf_cache()
+        st.download_button(
+            f"📥 {len(plan.matrices)}회차 자리표 한 번에 (PDF)",
+            deferred(
+                st.session_state["pdf_cache"],
+                ("rotation", content_key(plan.labels, plan.matrices, plan.seating_mode)),
+                lambda: render_plan_pdf(plan),
+            ),
+            file_name="seating_rotation_plan.pdf",
+            mime="application/pdf",
+            on_click="ignore",
+        )
+else:
+    st.info("명단을 올리거나 붙여 넣으면 자리 바꾸기 계획을 만들 수 있습니다 😊")
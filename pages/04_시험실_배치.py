@@ -0,0 +1,122 @@
+import pandas as pd
+import streamlit as st
+
+from seating.batch import cached_class_rosters
+from seating.examhall import (
+    RoomSpecError,
+    allocate_exam_rooms,
+    normalize_room_spec,
+    read_room_spec,
+    render_rooms_merged_pdf,
+    render_rooms_zip,
+    room_assignment_workbook,
+)
+
+# =========================================================
+# Streamlit UI (시험실 배치: 학년 전체 → 여러 시험실)
+# =========================================================
+st.set_page_config(page_title="시험실 배치", layout="centered")
+
+st.title("📝 시험실 좌석 배치 (학년 전체)")
+
+st.markdown(
+    """
+### 1️⃣ 학년 명단 업로드
+
+'여러 반 한 번에'와 같은 형식입니다.
+반마다 **시트를 하나씩** 만든 엑셀 1개, 또는 반마다 **파일을 하나씩** 올려 주세요.
+시험실 안에서는 **앞뒤·양옆에 다른 반 학생**이 앉도록 반을 섞어서 배치합니다.
+"""
+)
+
+uploaded_files = st.file_uploader(
+    "학년 명단 업로드 (.xlsx / .csv / .tsv, 여러 개 가능)", type=["xlsx", "csv", "tsv"], accept_multiple_files=True
+)
+
+if uploaded_files:
+    files = [(f.name, f.getvalue()) for f in uploaded_files]
+    classes = cached_class_rosters(st.session_state, files)
+
+    good = [cls for cls in classes if cls.ok]
+    for cls in classes:
+        if not cls.ok:
+            st.warning(f"⚠️ {cls.name}: {cls.error}")
+    total = sum(len(cls.roster) for cls in good)
+    st.success(f"✅ {len(good)}개 반, 학생 {total}명의 명단을 불러왔습니다.")
+
+    st.markdown("---")
+    st.subheader("2️⃣ 시험실 목록")
+    st.markdown("`시험실 | 줄 | 분단` 형식의 엑셀/CSV 파일을 올리거나, 아래 표를 직접 고쳐 주세요.")
+
+    room_file = st.file_uploader("시험실 목록 (.xlsx / .csv)", type=["xlsx", "csv"])
+    rooms = None
+    try:
+        if room_file is not None:
+            rooms = read_room_spec(room_file.name, room_file.getvalue())
+        else:
+            # 한 반에 30명 남짓이면 6줄 × 5분단 시험실이 반 수만큼 필요하다.
+            default_rooms = pd.DataFrame(
+                {
+                    "시험실": [f"{i + 1}실" for i in range(max(len(good), 1))],
+                    "줄": 6,
+                    "분단": 5,
+                }
+            )
+            edited = st.data_editor(default_rooms, num_rows="dynamic", hide_index=True)
+            rooms = normalize_room_spec(edited)
+    except RoomSpecError as e:
+        st.error(f"❌ {e}")
+
+    if rooms:
+        capacity = sum(room.capacity for room in rooms)
+        st.caption(f"시험실 {len(rooms)}개 · 자리 {capacity}석 / 학생 {total}명")
+
+        output = st.radio(
+            "받을 형식",
+            ["pdf", "zip"],
+            format_func=lambda x: "PDF 한 파일로 합치기" if x == "pdf" else "시험실별 PDF 묶음 (ZIP)",
+            horizontal=True,
+        )
+
+        if st.button("📝 시험실 배치 생성", type="primary", disabled=not good):
+            try:
+                with st.spinner("시험실 배치표를 만드는 중입니다..."):
+                    layouts = allocate_exam_rooms(good, rooms)
+                    if output == "pdf":
+                        data = render_rooms_merged_pdf(layouts)
+                        file_name, mime = "exam_rooms.pdf", "application/pdf"
+                    else:
+                        data = render_rooms_zip(layouts)
+                        file_name, mime = "exam_rooms.zip", "application/zip"
+                    workbook = room_assignment_workbook(layouts)
+            except RoomSpecError as e:
+                st.error(f"⚠️ {e}")
+            else:
+                st.markdown("---")
+                st.subheader("3️⃣ 다운로드")
+                st.dataframe(
+                    pd.DataFrame(
+                        {
+                            "시험실": [layout.room.name for layout in layouts],
+                            "학생 수": [len(layout.roster) for layout in layouts],
+                            "같은 반끼리 붙은 자리": [layout.same_class_neighbors for layout in layouts],
+                        }
+                    ),
+                    hide_index=True,
+                )
+                st.download_button(
+                    f"📥 {len(layouts)}개 시험실 좌석 배치표",
+                    data,
+                    file_name=file_name,
+                    mime=mime,
+                    on_click="ignore",
+                )
+                st.download_button(
+                    "📥 시험실별 명단 (엑셀, 시험실마다 시트 하나)",
+                    workbook,
+                    file_name="exam_rooms.xlsx",
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                    on_click="ignore",
+                )
+else:
+    st.info("학년 명단을 업로드하면 시험실 배치를 시작할 수 있습니다 😊")
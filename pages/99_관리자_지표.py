@@ -0,0 +1,110 @@
+import hmac
+import os
+
+import pandas as pd
+import streamlit as st
+
+from seating import metrics
+from seating.jobs import PDF_JOBS  # noqa: F401  (작업 큐를 지표에 등록)
+from seating.render import png  # noqa: F401  (PNG 글꼴 캐시를 지표에 등록)
+
+# =========================================================
+# Streamlit UI (관리자: 단계별 소요 시간 / 캐시 적중률)
+# =========================================================
+st.set_page_config(page_title="관리자 지표", layout="wide")
+
+st.title("📊 관리자 지표")
+
+# 비밀번호는 환경 변수로만 정한다. 없으면 이 페이지는 잠겨 있다.
+admin_password = os.environ.get("SEATING_ADMIN_PASSWORD", "")
+if not admin_password:
+    st.info("관리자 비밀번호(SEATING_ADMIN_PASSWORD 환경 변수)가 설정되지 않아 지표를 볼 수 없습니다.")
+    st.stop()
+
+if not st.session_state.get("admin_ok"):
+    entered = st.text_input("관리자 비밀번호", type="password")
+    if not entered:
+        st.stop()
+    if not hmac.compare_digest(entered.encode("utf-8"), admin_password.encode("utf-8")):
+        st.error("비밀번호가 맞지 않습니다.")
+        st.stop()
+    st.session_state["admin_ok"] = True
+
+st.caption("서버 프로세스가 뜬 뒤 모든 세션을 합친 값입니다. (작업자 프로세스 안의 단계는 'pdf_job' 으로 한꺼번에 잡힙니다)")
+
+# =========================================================
+# 1. 단계별 소요 시간
+# =========================================================
+st.subheader("1️⃣ 단계별 소요 시간 (합계가 큰 순서)")
+rows = metrics.stage_table()
+if rows:
+    st.dataframe(
+        pd.DataFrame(
+            [
+                {
+                    "단계": stage,
+                    "횟수": count,
+                    "평균 (ms)": mean * 1000,
+                    "p50 ≤ (ms)": p50 * 1000,
+                    "p95 ≤ (ms)": p95 * 1000,
+                    "최대 (ms)": peak * 1000,
+                    "합계 (s)": total,
+                }
+                for stage, count, mean, p50, p95, peak, total in rows
+            ]
+        ).style.format(precision=1),
+        hide_index=True,
+        width="stretch",
+    )
+else:
+    st.info("아직 기록된 단계가 없습니다. 좌석 배치 페이지를 한 번 사용해 보세요.")
+
+# =========================================================
+# 2. 캐시 / 작업 큐
+# =========================================================
+st.subheader("2️⃣ 캐시 적중률")
+st.caption("'disk' 는 여러 프로세스가 함께 쓰는 디스크 보관함(SEATING_CACHE_DIR 를 정했을 때만)이고, '디스크 적중' 은 메모리에 없어 디스크에서 찾은 횟수입니다.")
+cache_rows = []
+for name, stats in metrics.cache_stats().items():
+    lookups = stats["hits"] + stats["misses"]
+    cache_rows.append(
+        {
+            "캐시": name,
+            "항목 수": stats["entries"],
+            "크기 (KB)": stats["bytes"] / 1024 if stats["bytes"] is not None else None,
+            "적중": stats["hits"],
+            "실패": stats["misses"],
+            "디스크 적중": stats.get("disk_hits"),
+            "적중률 (%)": 100 * stats["hits"] / lookups if lookups else None,
+            "밀려남": stats["evictions"],
+        }
+    )
+st.dataframe(pd.DataFrame(cache_rows).style.format(precision=1), hide_index=True, width="stretch")
+
+st.subheader("3️⃣ 백그라운드 작업 큐")
+st.dataframe(
+    pd.DataFrame([{"큐": name, **stats} for name, stats in metrics.queue_stats().items()]),
+    hide_index=True,
+    width="stretch",
+)
+
+# =========================================================
+# 3. Prometheus 텍스트
+# =========================================================
+st.subheader("4️⃣ Prometheus 형식")
+text = metrics.prometheus_text()
+port = os.environ.get("SEATING_METRICS_PORT")
+if port:
+    st.caption(f"같은 내용을 http://{os.environ.get('SEATING_METRICS_HOST', '127.0.0.1')}:{port}/metrics 에서도 읽을 수 있습니다.")
+with st.expander("텍스트 보기"):
+    st.code(text, language="text")
+st.download_button("📥 metrics.txt", text, file_name="metrics.txt", mime="text/plain", on_click="ignore")
+
+c1, c2 = st.columns(2)
+with c1:
+    if st.button("🔄 새로 고침"):
+        st.rerun()
+with c2:
+    if st.button("🧹 단계별 시간 초기화"):
+        metrics.reset()
+        st.rerun()
@@ -0,0 +1,30 @@
+"""좌석 배치 도구 공용 패키지.
+
+페이지 스크립트(pages/*.py)는 화면만 담당하고, 배치 엔진·명단 읽기·출력(HTML/PDF)은
+모두 이 패키지에 있다. streamlit 은 seating.ui 에서만 import 하므로 나머지는
+스크립트나 벤치마크에서 그대로 가져다 쓸 수 있다.
+"""
+
+from seating.engines import (
+    assign_seats_by_number,
+    assign_seats_random,
+    student_row_to_seat,
+)
+from seating.render import get_renderer
+from seating.render.html import HTML_STYLE, render_chart
+from seating.render.pdf import make_pdf, make_pdf_both
+from seating.roster import REQUIRED_COLS, RosterError, read_roster
+
+__all__ = [
+    "HTML_STYLE",
+    "REQUIRED_COLS",
+    "RosterError",
+    "assign_seats_by_number",
+    "assign_seats_random",
+    "get_renderer",
+    "make_pdf",
+    "make_pdf_both",
+    "read_roster",
+    "render_chart",
+    "student_row_to_seat",
+]
@@ -0,0 +1,5 @@
+import sys
+
+from seating.cli import main
+
+sys.exit(main())
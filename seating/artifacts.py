@@ -0,0 +1,222 @@
+"""여러 프로세스·재시작 사이에 함께 쓰는 디스크 결과 보관함 (내용 해시 = 파일 이름).
+
+같은 배치의 PDF·좌석표 HTML·배치·명단은 키(content_key / 파일 해시)가 같으므로 한 번 만든
+결과를 파일로 두고, 다른 세션·다른 작업자 프로세스·재시작한 서버가 그대로 읽어 간다.
+SEATING_CACHE_DIR 를 정한 경우에만 켜진다 (명령줄 도구·스크립트는 기본으로 디스크에 남기지 않는다).
+
+- 쓰기는 같은 폴더의 임시 파일에 다 쓴 뒤 os.replace 로 바꾸므로 읽는 쪽은 항상 완성된 파일만 본다.
+- 읽을 때 파일 시각을 갱신해 두고, 전체 크기가 한도를 넘으면 오래 안 쓴 파일부터 지운다.
+  지우기는 잠금 파일(flock)로 한 프로세스만 하고, 다른 프로세스는 기다리지 않고 넘어간다.
+"""
+
+import os
+import re
+import tempfile
+import threading
+import time
+import warnings
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없이 (쓰기는 그래도 원자적)
+    fcntl = None
+
+from seating.metrics import register_cache
+
+# 같은 키로 다른 결과가 나오게 바뀌면(그리는 방식 변경 등) 올린다. 예전 파일은 안 읽히고 밀려난다.
+ARTIFACT_VERSION = 2
+DEFAULT_MAX_MB = 512
+LOW_WATER = 0.9  # 한도를 넘으면 90% 까지 줄인다
+STALE_TMP_SECONDS = 3600  # 쓰다 죽은 임시 파일은 한 시간 뒤에 지운다
+
+_KEY = re.compile(r"[0-9a-f]{8,64}")
+_NAMESPACE = re.compile(r"[a-z0-9_-]+")
+
+
+class ArtifactStore:
+    def __init__(self, root, max_bytes):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._written = max_bytes  # 처음 쓰기 때 한 번 크기를 훑는다
+
+        self._entries = 0
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _path(self, namespace: str, key: str):
+        # 키는 해시 문자열만 받는다 (경로 조작 방지). 아니면 None
+        if not _NAMESPACE.fullmatch(namespace) or not _KEY.fullmatch(key):
+            return None
+        return self.root / f"v{ARTIFACT_VERSION}" / namespace / key[:2] / key
+
+    # =========================================================
+    # 1. 읽기 / 쓰기
+    # =========================================================
+    def get(self, namespace: str, key: str):
+        path = self._path(namespace, key)
+        try:
+            data = path.read_bytes() if path is not None else None
+        except OSError:  # 없거나 방금 다른 프로세스가 지운 파일
+            data = None
+        with self._lock:
+            if data is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        try:
+            os.utime(path)  # 최근에 쓴 파일로 표시 (지울 때 순서)
+        except OSError:
+            pass
+        return data
+
+    def put(self, namespace: str, key: str, data: bytes):
+        path = self._path(namespace, key)
+        if path is None or len(data) > self.max_bytes:
+            return
+        if path.exists():
+            # 같은 키 = 같은 내용. 다시 쓰지 않고 시각만 갱신한다.
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            return
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        except OSError:
+            return  # 폴더를 만들 수 없으면 메모리 캐시만 쓴다
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            return  # 디스크가 꽉 찼으면 메모리 캐시만 쓴다
+
+        with self._lock:
+            self._entries += 1
+            self._bytes += len(data)
+            self._written += len(data)
+            # 다른 프로세스가 쓴 양은 모르므로, 한도의 1/8 만큼 쓸 때마다 폴더를 다시 훑는다.
+            scan = self._written >= self.max_bytes // 8
+            if scan:
+                self._written = 0
+        if scan:
+            self.evict()
+
+    # =========================================================
+    # 2. 크기 제한 (오래 안 쓴 파일부터)
+    # =========================================================
+    def _scan(self):
+        files = []
+        now = time.time()
+        for dirpath, _, names in os.walk(self.root):
+            for name in names:
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                if name.endswith(".tmp"):
+                    if now - st.st_mtime > STALE_TMP_SECONDS:
+                        _unlink(path)
+                    continue
+                if name != ".lock":
+                    files.append((st.st_mtime, st.st_size, path))
+        return files
+
+    def evict(self):
+        try:
+            lock = open(self.root / ".lock", "a")
+        except OSError:
+            return
+        with lock:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    return  # 다른 프로세스가 정리 중
+            files = self._scan()
+            total = sum(size for _, size, _ in files)
+            removed = 0
+            if total > self.max_bytes:
+                files.sort()
+                target = self.max_bytes * LOW_WATER
+                for _, size, path in files:
+                    if total <= target:
+                        break
+                    if _unlink(path):
+                        total -= size
+                        removed += 1
+        with self._lock:
+            self._entries = len(files) - removed
+            self._bytes = total
+            self.evictions += removed
+
+    def clear(self):
+        for _, _, path in self._scan():
+            _unlink(path)
+        with self._lock:
+            self._entries = 0
+            self._bytes = 0
+
+    def stats(self):
+        # 크기/항목 수는 마지막으로 훑은 값 + 이 프로세스가 그 뒤에 쓴 양 (대략값)
+        return {
+            "entries": self._entries,
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+def _unlink(path):
+    try:
+        os.unlink(path)
+        return True
+    except OSError:
+        return False
+
+
+_store = None
+_store_ready = False
+_store_lock = threading.Lock()
+
+
+def _max_mb():
+    raw = os.environ.get("SEATING_CACHE_MAX_MB", "").strip()
+    if not raw:
+        return DEFAULT_MAX_MB
+    try:
+        return float(raw)
+    except ValueError:
+        warnings.warn(
+            f"SEATING_CACHE_MAX_MB={raw!r} 를 숫자로 읽을 수 없어 기본값 {DEFAULT_MAX_MB}MB 를 씁니다.",
+            stacklevel=3,
+        )
+        return DEFAULT_MAX_MB
+
+
+def get_store():
+    # 디스크 보관함은 SEATING_CACHE_DIR 를 정했을 때만 쓴다 (학생 이름이 든 결과를 묻지 않고 남기지 않는다).
+    # SEATING_CACHE_MAX_MB (기본 512, 0 이하면 끔). 처음 쓰는 순간에 한 번만 만든다. 없으면 None
+    global _store, _store_ready
+    if _store_ready:
+        return _store
+    with _store_lock:
+        if not _store_ready:
+            root = os.environ.get("SEATING_CACHE_DIR", "").strip()
+            max_mb = _max_mb() if root else 0
+            if max_mb > 0:
+                _store = register_cache("disk", ArtifactStore(root, int(max_mb * 1024 * 1024)))
+            _store_ready = True
+    return _store
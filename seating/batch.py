@@ -0,0 +1,168 @@
+"""여러 반을 한 번에: 반별 명단 → 배치 → 합본 PDF 또는 반별 PDF ZIP."""
+
+import io
+import multiprocessing
+import os
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+
+import pandas as pd
+
+from seating.engines import LayoutOptions, assign_seats
+from seating.render.pdf import make_pdf_both
+from seating.render.pdf_forms import build_form_pdf_document
+from seating.roster import RosterError, file_digest, read_roster_sheets
+from seating.seatmatrix import SeatMatrix
+
+
+@dataclass
+class ClassLayout:
+    name: str
+    roster: pd.DataFrame | None = None
+    matrix: SeatMatrix | None = None
+    error: str | None = None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+# =========================================================
+# 1. 반별 명단 읽기 (여러 시트 / 여러 파일)
+# =========================================================
+def read_class_rosters(files):
+    # files: [(파일 이름, bytes), ...]
+    # 시트가 하나면 파일 이름이, 여러 개면 시트 이름이 반 이름이 된다.
+    classes = []
+    for file_name, data in files:
+        stem = os.path.splitext(os.path.basename(file_name))[0]
+        try:
+            sheets = read_roster_sheets(data, file_name)
+        except Exception as e:
+            classes.append(ClassLayout(stem, error=f"명단 파일을 읽을 수 없습니다: {e}"))
+            continue
+
+        for sheet_name, roster in sheets:
+            if len(sheets) == 1:
+                name = stem
+            elif len(files) == 1:
+                name = str(sheet_name)
+            else:
+                name = f"{stem} {sheet_name}"
+
+            if isinstance(roster, RosterError):
+                classes.append(ClassLayout(name, error=str(roster)))
+            else:
+                classes.append(ClassLayout(name, roster=roster))
+    return classes
+
+
+def cached_class_rosters(state, files):
+    # 세션에 파일 내용 해시별로 보관해 두고, 배치 결과를 담을 새 ClassLayout 을 돌려준다.
+    key = tuple(file_digest(data) for _, data in files)
+    cached = state.get("class_rosters")
+    if cached is None or cached[0] != key:
+        cached = (key, read_class_rosters(files))
+        state["class_rosters"] = cached
+    return [ClassLayout(cls.name, cls.roster, None, cls.error) for cls in cached[1]]
+
+
+# =========================================================
+# 2. 반별 배치
+# =========================================================
+def assign_all(classes, options: LayoutOptions, seed=None):
+    for cls in classes:
+        if not cls.ok:
+            continue
+        if len(cls.roster) > options.capacity:
+            cls.error = f"좌석이 부족합니다 (학생 {len(cls.roster)}명 / 자리 {options.capacity}석)"
+            continue
+        cls.matrix = assign_seats(cls.roster, options, seed)
+    return classes
+
+
+def class_titles(name: str):
+    return f"{name} 교사용 좌석 배치표", f"{name} 학생용 좌석 배치표"
+
+
+# =========================================================
+# 3. 출력
+# =========================================================
+def render_merged_pdf(classes, options: LayoutOptions):
+    # 합본은 한 canvas 에 이어 그려야 하므로 한 프로세스에서 만든다 (폰트 서브셋 1회).
+    # 반마다 격자 모양이 같으므로 배경은 Form XObject 하나를 모든 페이지가 같이 쓴다.
+    sections = []
+    for cls in classes:
+        if cls.matrix is None:
+            continue
+        teacher_title, student_title = class_titles(cls.name)
+        pages = [("teacher", teacher_title), ("student", student_title)]
+        sections.append((cls.matrix, options.mode, options.bun_dan, pages))
+    return build_form_pdf_document(sections)
+
+
+def _render_class_pdf(job):
+    # 프로세스 풀 작업자: (반 이름, 배치, 옵션) → (반 이름, PDF bytes)
+    name, matrix, options = job
+    teacher_title, student_title = class_titles(name)
+    return name, make_pdf_both(matrix, options.mode, options.bun_dan, teacher_title, student_title)
+
+
+# 작업자 프로세스를 띄우는 비용(spawn, 패키지 import, 폰트 파싱)이 반 하나 그리는 것보다
+# 훨씬 크므로, 풀은 한 번 만들어 서버가 살아 있는 동안 재사용한다.
+PARALLEL_MIN_JOBS = 4
+
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def get_process_pool(workers: int):
+    global _pool, _pool_workers
+    with _pool_lock:
+        # 작업자 하나가 죽으면(메모리 부족 등) 풀 전체가 BrokenProcessPool 상태로 남아
+        # 이후 작업이 모두 실패하므로, 그런 풀은 버리고 새로 만든다.
+        broken = _pool is not None and getattr(_pool, "_broken", False)
+        if _pool is None or broken or _pool_workers < workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=broken)
+            # Streamlit 서버는 여러 스레드로 돌기 때문에 fork 대신 spawn 으로 작업자를 띄운다.
+            ctx = multiprocessing.get_context("spawn")
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=ctx)
+            _pool_workers = workers
+        return _pool
+
+
+def parallel_imap(func, jobs, workers: int | None = None):
+    # 결과를 끝나는 대로(입력 순서대로) 하나씩 내준다. jobs 가 적거나 CPU 가 하나뿐이면
+    # 그냥 현재 프로세스에서 차례로 처리한다.
+    jobs = list(jobs)
+    if workers is None:
+        workers = min(len(jobs), os.cpu_count() or 1)
+    if workers <= 1 or len(jobs) < PARALLEL_MIN_JOBS:
+        return map(func, jobs)
+    try:
+        return get_process_pool(workers).map(func, jobs)
+    except BrokenProcessPool:
+        # 풀을 받은 직후에 깨진 경우: 다시 받으면 새 풀이다
+        return get_process_pool(workers).map(func, jobs)
+
+
+def parallel_map(func, jobs, workers: int | None = None):
+    return list(parallel_imap(func, jobs, workers))
+
+
+def render_class_pdfs(classes, options: LayoutOptions, workers: int | None = None):
+    jobs = [(cls.name, cls.matrix, options) for cls in classes if cls.matrix is not None]
+    return parallel_map(_render_class_pdf, jobs, workers)
+
+
+def render_zip(classes, options: LayoutOptions, workers: int | None = None):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, pdf in render_class_pdfs(classes, options, workers):
+            zf.writestr(f"{name.replace('/', '_')}.pdf", pdf)
+    return buf.getvalue()
@@ -0,0 +1,230 @@
+"""배치 결과(PDF 등)를 내용 해시로 찾아 쓰는 프로세스 공용 LRU 캐시 (+ 디스크 보관함)."""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+from seating.artifacts import get_store
+from seating.metrics import register_cache
+
+
+# =========================================================
+# 1. 내용 해시 키
+# =========================================================
+def _key_default(obj):
+    # SeatMatrix 처럼 digest() 가 있는 객체는 그 값으로 대신한다.
+    digest = getattr(obj, "digest", None)
+    if callable(digest):
+        return digest()
+    return str(obj)
+
+
+def content_key(*parts):
+    # 좌석 행렬(SeatMatrix 또는 dict/None 의 리스트)과 옵션 값들을 직렬화해서 해시한다.
+    raw = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=_key_default)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+# =========================================================
+# 2. 크기 제한이 있는 LRU 캐시
+# =========================================================
+class LRUCache:
+    def __init__(self, max_entries=128, max_bytes=None, sizeof=len):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+
+        self._data = OrderedDict()  # key -> (value, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    @property
+    def total_bytes(self):
+        return self._bytes
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def peek(self, key, default=None):
+        # 메모리에 있는지만 본다: 적중/실패 통계도, LRU 순서도 바꾸지 않는다 (상태 확인용).
+        # TieredCache 에서도 디스크는 읽지 않는다.
+        item = self._data.get(key)
+        return default if item is None else item[0]
+
+    def put(self, key, value):
+        size = self.sizeof(value)
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+
+            # 한 항목이 전체 한도보다 크면 캐시하지 않는다.
+            if self.max_bytes is not None and size > self.max_bytes:
+                return value
+
+            self._data[key] = (value, size)
+            self._bytes += size
+            self._evict()
+        return value
+
+    def get_or_create(self, key, factory):
+        value = self.get(key)
+        if value is None:
+            value = self.put(key, factory())
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self):
+        return {
+            "entries": len(self._data),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _evict(self):
+        while self._data and (
+            (self.max_entries is not None and len(self._data) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, (_, size) = self._data.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+
+
+# =========================================================
+# 3. 메모리 + 디스크 (프로세스·재시작 사이에 공유)
+# =========================================================
+def encode_blob(value):
+    # bytes / str 만 디스크에 둔다. 그 밖의 값은 None (메모리에만)
+    if isinstance(value, bytes):
+        return b"b" + value
+    if isinstance(value, str):
+        return b"s" + value.encode("utf-8")
+    return None
+
+
+def decode_blob(data: bytes):
+    tag, body = data[:1], data[1:]
+    if tag == b"b":
+        return body
+    if tag == b"s":
+        return body.decode("utf-8")
+    raise ValueError("알 수 없는 보관 형식")
+
+
+_SHARED_STORE = object()
+
+
+class TieredCache(LRUCache):
+    # 메모리에 없으면 디스크 보관함(namespace/키)에서 찾고, 넣을 때는 둘 다에 넣는다.
+    # encode/decode 로 값 ↔ bytes 를 바꾼다 (encode 가 None 을 돌려주면 메모리에만).
+    # disk 를 주지 않으면 처음 쓸 때 공용 보관함(get_store)을 찾는다. 꺼져 있으면 메모리만 쓴다.
+    def __init__(self, namespace, *args, disk=_SHARED_STORE, encode=encode_blob, decode=decode_blob, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.namespace = namespace
+        self._disk = disk
+        self.encode = encode
+        self.decode = decode
+        self.disk_hits = 0
+
+    @property
+    def disk(self):
+        if self._disk is _SHARED_STORE:
+            self._disk = get_store()
+        return self._disk
+
+    @disk.setter
+    def disk(self, store):
+        self._disk = store
+
+    def get(self, key, default=None):
+        value = super().get(key)
+        if value is None and self.disk is not None:
+            data = self.disk.get(self.namespace, key)
+            if data is not None:
+                try:
+                    value = self.decode(data)
+                except Exception:
+                    value = None  # 깨졌거나 예전 형식이면 새로 만든다
+                if value is not None:
+                    self.disk_hits += 1
+                    LRUCache.put(self, key, value)
+        return default if value is None else value
+
+    def put(self, key, value):
+        super().put(key, value)
+        if self.disk is not None:
+            data = self.encode(value)
+            if data is not None:
+                self.disk.put(self.namespace, key, data)
+        return value
+
+    def stats(self):
+        # hits 는 메모리 적중만, 디스크에서 찾은 횟수는 disk_hits 로 따로 센다.
+        return {**super().stats(), "disk_hits": self.disk_hits}
+
+
+# =========================================================
+# 4. 프로세스 공용 캐시 인스턴스
+# =========================================================
+# 페이지 스크립트는 매번 다시 실행되므로 캐시는 import 되는 이 모듈에 둔다.
+# PDF·좌석표 HTML·SVG/PNG 는 디스크에도 두어 다른 프로세스나 재시작한 서버가 바로 쓴다.
+PDF_CACHE = register_cache("pdf", TieredCache("pdf", max_entries=256, max_bytes=64 * 1024 * 1024))
+
+# PDF 한 페이지 분량의 그리기 명령 목록 (교사용/학생용 각각 한 번만 계산)
+PAGE_CACHE = register_cache(
+    "page", LRUCache(max_entries=512, max_bytes=16 * 1024 * 1024, sizeof=lambda ops: 200 * len(ops))
+)
+
+# PDF 이름 크기/줄바꿈 (명단 + 칸 크기별, 교사용/학생용이 같이 쓴다)
+FIT_CACHE = register_cache("fit", LRUCache(max_entries=256))
+
+# 화면용 HTML 좌석표 조각 (배치 해시별)
+CHART_CACHE = register_cache(
+    "chart", TieredCache("chart", max_entries=256, max_bytes=16 * 1024 * 1024)
+)
+
+# SVG / PNG / 인쇄용 HTML 결과 (형식 + 배치 + 페이지 구성별)
+EXPORT_CACHE = register_cache(
+    "export", TieredCache("export", max_entries=128, max_bytes=32 * 1024 * 1024)
+)
+
+
+# =========================================================
+# 5. 지연 생성
+# =========================================================
+def deferred(cache, key, factory):
+    # st.download_button(data=...) 에 넘기면 버튼을 실제로 눌렀을 때만 만들어진다.
+    def _build():
+        return cache.get_or_create(key, factory)
+
+    return _build
+
+
+def new_session_pdf_cache():
+    # 세션별 PDF 보관함: 최근 배치 몇 개 분량만 들고 있는다.
+    return LRUCache(max_entries=6, max_bytes=8 * 1024 * 1024)
@@ -0,0 +1,192 @@
+"""명령줄에서 좌석 배치표 만들기 (Streamlit 없이).
+
+예시::
+
+    python -m seating 2학년.xlsx --engine number --bun-dan 5 --rows 6 -o out/
+    python -m seating 1반.xlsx 2반.xlsx --mode Paired --format pdf html -j 4
+    python -m seating 1반.xlsx --format svg png print-html
+    python -m seating 1반.xlsx --history random_seating_history.json
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from seating.batch import assign_all, class_titles, parallel_imap, read_class_rosters
+from seating.engines import LayoutOptions
+from seating.history import load_history_json
+from seating.render import RENDERERS, get_renderer
+from seating.roster import roster_digest
+
+
+# =========================================================
+# 1. 라이브러리 진입점
+# =========================================================
+def _render_class_outputs(job):
+    # 프로세스 풀 작업자: (반 이름, 배치, 옵션, 형식 목록) → (반 이름, {형식: bytes})
+    name, matrix, options, formats = job
+    teacher_title, student_title = class_titles(name)
+    outputs = {}
+    for fmt in formats:
+        data = get_renderer(fmt).render_both(
+            matrix, options.mode, options.bun_dan, teacher_title, student_title
+        )
+        outputs[fmt] = data.encode("utf-8") if isinstance(data, str) else data
+    return name, outputs
+
+
+def generate(
+    files, options: LayoutOptions, formats=("pdf",), out_dir=".", workers=None, seed=None
+):
+    # files: 엑셀 경로 목록. 반마다 결과 파일을 쓰는 대로 (반 이름, 경로 또는 None, 오류) 를 내준다.
+    rosters = []
+    for path in files:
+        with open(path, "rb") as f:
+            rosters.append((path, f.read()))
+
+    classes = assign_all(read_class_rosters(rosters), options, seed)
+    for cls in classes:
+        if cls.matrix is None:
+            yield cls.name, None, cls.error
+
+    jobs = [(cls.name, cls.matrix, options, tuple(formats)) for cls in classes if cls.matrix is not None]
+    yield from _write_outputs(jobs, out_dir, workers)
+
+
+def replay(files, history_text: str, formats=("pdf",), out_dir=".", workers=None):
+    # 화면에서 내보낸 배치 기록(JSON)의 시드/옵션/조건으로 같은 배치를 다시 만든다.
+    # 기록의 명단 해시와 내용이 같은 반에만 적용된다.
+    try:
+        entries = load_history_json(history_text)
+    except (json.JSONDecodeError, KeyError, ValueError, TypeError, AttributeError) as e:
+        # 깨졌거나 다른 프로그램의 JSON: 반마다 실패하는 대신 한 번만 알리고 끝낸다.
+        detail = f"'{e.args[0]}' 항목이 없습니다" if isinstance(e, KeyError) else str(e)
+        yield "배치 기록", None, f"배치 기록 파일을 읽을 수 없습니다 ({detail})."
+        return
+    rosters = []
+    for path in files:
+        with open(path, "rb") as f:
+            rosters.append((path, f.read()))
+
+    jobs = []
+    for cls in read_class_rosters(rosters):
+        if not cls.ok:
+            yield cls.name, None, cls.error
+            continue
+        digest = roster_digest(cls.roster)
+        for entry in entries:
+            if entry.roster == digest:
+                # 기록에 격자가 있으면 그대로 (직접 수정한 배치 포함), 없으면 시드로 다시 만든다.
+                matrix = entry.restore(cls.roster)
+                name = f"{cls.name}_시드{entry.seed}" + (f"_{entry.note}" if entry.note else "")
+                # 같은 시드를 고쳐 쓴 기록이 여럿이면 _write_outputs 가 파일 이름 뒤에 번호를 붙인다.
+                jobs.append((name, matrix, entry.options, tuple(formats)))
+    if not jobs:
+        yield "배치 기록", None, "기록과 같은 명단을 찾지 못했습니다."
+    yield from _write_outputs(jobs, out_dir, workers)
+
+
+def _write_outputs(jobs, out_dir, workers):
+    # 이름이 같은 반(다른 폴더의 같은 파일 이름 등)은 뒤에 _2, _3 … 을 붙여 서로 덮어쓰지 않게 한다.
+    # 결과는 입력 순서대로 나오므로 번호도 실행할 때마다 같다.
+    os.makedirs(out_dir, exist_ok=True)
+    used = set()
+    for name, outputs in parallel_imap(_render_class_outputs, jobs, workers):
+        base = name.replace("/", "_")
+        safe_name, n = base, 2
+        while safe_name.casefold() in used:  # 대소문자를 가리지 않는 파일 시스템
+            safe_name, n = f"{base}_{n}", n + 1
+        used.add(safe_name.casefold())
+        for fmt, data in outputs.items():
+            path = os.path.join(out_dir, f"{safe_name}.{get_renderer(fmt).extension}")
+            with open(path, "wb") as f:
+                f.write(data)
+            yield name, path, None
+
+
+# =========================================================
+# 2. 명령줄 인자
+# =========================================================
+def _positive_int(text: str):
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"정수가 아닙니다: {text!r}") from None
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 합니다: {value}")
+    return value
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m seating",
+        description="엑셀 명단으로 좌석 배치표(PDF/HTML/SVG/PNG)를 만듭니다.",
+    )
+    parser.add_argument("files", nargs="+", help="명단 파일 (.xlsx 는 시트마다 한 반 가능, .csv / .tsv 도 가능)")
+    parser.add_argument("--engine", choices=["random", "number"], default="random", help="배치 방식")
+    parser.add_argument(
+        "--mode", dest="seating_mode", choices=["Single", "Paired"], default="Single",
+        help="좌석 형태 (랜덤 배치 전용)",
+    )
+    parser.add_argument("--bun-dan", type=_positive_int, default=4, help="분단 수")
+    parser.add_argument("--rows", type=_positive_int, default=6, help="줄 수(행)")
+    parser.add_argument("--sort-order", choices=["asc", "desc"], default="asc", help="번호순 정렬")
+    parser.add_argument("--start-side", choices=["left", "right"], default="left", help="번호순 시작 위치")
+    parser.add_argument(
+        "--seed", type=int, default=None,
+        help="랜덤 배치 시드 (화면에서 내보낸 배치 기록의 시드를 넣으면 같은 배치)",
+    )
+    parser.add_argument(
+        "--history", default=None,
+        help="화면에서 내보낸 배치 기록(JSON) — 기록된 배치를 그대로 다시 만든다 (배치 옵션 무시)",
+    )
+    parser.add_argument(
+        "--format", dest="formats", nargs="+", choices=sorted(RENDERERS), default=["pdf"],
+        help="출력 형식",
+    )
+    parser.add_argument("-o", "--out-dir", default=".", help="결과를 저장할 폴더")
+    parser.add_argument(
+        "-j", "--parallel", dest="workers", type=_positive_int, default=None,
+        help="동시에 그릴 프로세스 수 (기본: CPU 수)",
+    )
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    # 형식마다 "<반 이름>.<확장자>" 파일 하나를 쓰므로, 확장자가 겹치면 앞의 결과를 덮어쓴다.
+    args.formats = list(dict.fromkeys(args.formats))
+    extensions = [get_renderer(fmt).extension for fmt in args.formats]
+    if len(set(extensions)) < len(extensions):
+        parser.error(f"출력 파일 확장자가 겹치는 형식은 함께 고를 수 없습니다: {', '.join(args.formats)}")
+    options = LayoutOptions(
+        engine=args.engine,
+        rows=args.rows,
+        bun_dan=args.bun_dan,
+        seating_mode=args.seating_mode,
+        sort_order=args.sort_order,
+        start_side=args.start_side,
+    )
+
+    if args.history:
+        try:
+            with open(args.history, encoding="utf-8") as f:
+                history_text = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            parser.error(f"배치 기록 파일을 열 수 없습니다: {e}")
+        results = replay(args.files, history_text, args.formats, args.out_dir, args.workers)
+    else:
+        results = generate(
+            args.files, options, args.formats, args.out_dir, args.workers, args.seed
+        )
+
+    failed = 0
+    for name, path, error in results:
+        if error:
+            failed += 1
+            print(f"[실패] {name}: {error}", file=sys.stderr, flush=True)
+        else:
+            print(path, flush=True)
+    return 1 if failed else 0
@@ -0,0 +1,265 @@
+"""조건을 지키는 랜덤 좌석 배치 (국소 탐색 / 담금질).
+
+지원하는 조건
+- 서로 떨어뜨릴 학생 쌍: 앞뒤·양옆·대각선으로 붙어 앉지 않게
+- 앞줄에 앉힐 학생: 앞에서 front_rows 줄 안에
+- 짝 모드에서 남녀 짝
+- 지난 학기 짝(옆자리)과 다시 짝이 되지 않게
+
+학생 두 명의 자리를 바꾸는 이동만 쓰고, 바꾼 두 자리 주변의 비용만 다시 계산한다.
+"""
+
+import math
+import random
+import re
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from seating.engines import seat_table
+from seating.seatmatrix import SeatMatrix
+
+W_APART = 10.0
+W_FRONT = 5.0
+W_PARTNER = 3.0
+W_GENDER = 1.0
+W_REPEAT = 2.0  # 이전 회차에서 이미 짝이었던 횟수당
+
+
+@dataclass
+class SeatingConstraints:
+    apart: list = field(default_factory=list)  # [(번호, 번호), ...]
+    front: list = field(default_factory=list)  # [번호, ...]
+    front_rows: int = 2
+    mixed_gender_pairs: bool = False  # Paired 모드 전용
+    previous_partners: list = field(default_factory=list)  # [(번호, 번호), ...]
+
+    def is_empty(self):
+        return not (self.apart or self.front or self.mixed_gender_pairs or self.previous_partners)
+
+
+def parse_pairs(text: str):
+    # "3, 17" / "3 17" / "3-17" 처럼 한 줄에 번호 두 개씩
+    pairs = []
+    for line in (text or "").splitlines():
+        nums = re.findall(r"[^\s,\-/~]+", line)
+        if len(nums) >= 2:
+            pairs.append((nums[0], nums[1]))
+    return pairs
+
+
+# =========================================================
+# 1. 비용 계산 (자리 단위, 증분)
+# =========================================================
+class _Problem:
+    def __init__(self, df, rows, cols, paired, constraints: SeatingConstraints, repeat=None):
+        self.rows = rows
+        self.cols = cols
+        n = len(df)
+        self.n = n
+
+        numbers = df["출석 번호"].astype(str).str.strip().tolist()
+        index_of = {num: i for i, num in enumerate(numbers)}
+
+        gender = df["성별"].astype(str).map({"남": 1, "여": 2}).fillna(0).astype(int)
+        self.gender = gender.tolist()
+        self.mixed = bool(constraints.mixed_gender_pairs and paired)
+
+        self.apart = [set() for _ in range(n)]
+        self.prev = [set() for _ in range(n)]
+        self.front = [False] * n
+        self.front_rows = max(1, int(constraints.front_rows))
+        self.unknown = []
+
+        def resolve(num):
+            i = index_of.get(str(num).strip())
+            if i is None:
+                self.unknown.append(str(num))
+            return i
+
+        for sets, pairs in ((self.apart, constraints.apart), (self.prev, constraints.previous_partners)):
+            for a, b in pairs:
+                i, j = resolve(a), resolve(b)
+                if i is not None and j is not None and i != j:
+                    sets[i].add(j)
+                    sets[j].add(i)
+        for num in constraints.front:
+            i = resolve(num)
+            if i is not None:
+                self.front[i] = True
+
+        # repeat[i][j]: 이전 회차들에서 i, j 가 짝(옆자리)이었던 횟수
+        self.repeat = repeat.tolist() if repeat is not None else None
+
+        # 조건이 걸린 학생 (이동 후보로 자주 뽑는다)
+        if self.mixed or self.repeat is not None:
+            self.hot = list(range(n))
+        else:
+            self.hot = [i for i in range(n) if self.apart[i] or self.prev[i] or self.front[i]]
+
+        # 자리별 이웃: (이웃 자리, 짝 관계 여부)
+        self.neighbors = []
+        for s in range(rows * cols):
+            r, c = divmod(s, cols)
+            nbrs = []
+            for dr in (-1, 0, 1):
+                for dc in (-1, 0, 1):
+                    if (dr or dc) and 0 <= r + dr < rows and 0 <= c + dc < cols:
+                        t = (r + dr) * cols + (c + dc)
+                        if paired:
+                            is_partner = dr == 0 and c // 2 == (c + dc) // 2
+                        else:
+                            is_partner = dr == 0
+                        nbrs.append((t, is_partner))
+            self.neighbors.append(nbrs)
+
+    def pair_cost(self, i, j, is_partner):
+        cost = 0.0
+        if j in self.apart[i]:
+            cost += W_APART
+        if is_partner:
+            if j in self.prev[i]:
+                cost += W_PARTNER
+            if self.mixed and self.gender[i] and self.gender[i] == self.gender[j]:
+                cost += W_GENDER
+            if self.repeat is not None:
+                cost += W_REPEAT * self.repeat[i][j]
+        return cost
+
+    def unary_cost(self, i, s):
+        if self.front[i]:
+            r = s // self.cols
+            if r >= self.front_rows:
+                return W_FRONT * (r - self.front_rows + 1)
+        return 0.0
+
+    def pair_sum(self, occ, s):
+        i = occ[s]
+        cost = 0.0
+        for t, is_partner in self.neighbors[s]:
+            j = occ[t]
+            if j >= 0:
+                cost += self.pair_cost(i, j, is_partner)
+        return cost
+
+    def local_cost(self, occ, s):
+        i = occ[s]
+        if i < 0:
+            return 0.0
+        return self.unary_cost(i, s) + self.pair_sum(occ, s)
+
+    def total_cost(self, occ):
+        # 이웃 쌍 비용은 양쪽 자리에서 한 번씩 세므로 절반만 더한다.
+        cost = 0.0
+        for s, i in enumerate(occ):
+            if i >= 0:
+                cost += self.unary_cost(i, s) + self.pair_sum(occ, s) / 2
+        return cost
+
+    def violations(self, occ, labels):
+        msgs = []
+        for s, i in enumerate(occ):
+            if i < 0:
+                continue
+            if self.unary_cost(i, s):
+                msgs.append(f"{labels[i]}: 앞 {self.front_rows}줄 안에 앉히지 못했습니다.")
+            for t, is_partner in self.neighbors[s]:
+                j = occ[t]
+                if j <= i:
+                    continue
+                if j in self.apart[i]:
+                    msgs.append(f"{labels[i]} ↔ {labels[j]}: 붙어 앉게 되었습니다.")
+                if is_partner and j in self.prev[i]:
+                    msgs.append(f"{labels[i]} ↔ {labels[j]}: 지난 학기 짝과 다시 짝입니다.")
+                if is_partner and self.mixed and self.gender[i] and self.gender[i] == self.gender[j]:
+                    msgs.append(f"{labels[i]} ↔ {labels[j]}: 같은 성별 짝입니다.")
+        return msgs
+
+
+# =========================================================
+# 2. 담금질 탐색
+# =========================================================
+def _anneal(problem: _Problem, occ, rng: random.Random, max_iters: int, patience: int = 3000):
+    n = problem.n
+    cost = problem.total_cost(occ)
+    if cost == 0 or n < 2:
+        return occ, cost
+
+    pos = [0] * n
+    for s, i in enumerate(occ):
+        if i >= 0:
+            pos[i] = s
+
+    best, best_cost = list(occ), cost
+    t0, t1 = 2.0, 0.01
+    hot = problem.hot or list(range(n))
+
+    last_improved = 0
+    for it in range(max_iters):
+        # 한동안 더 나아지지 않으면 (조건을 다 지킬 수 없는 경우) 일찍 멈춘다.
+        if it - last_improved > patience:
+            break
+        temp = t0 * (t1 / t0) ** (it / max_iters)
+
+        # 조건이 걸린 학생 하나와 아무 학생 하나를 맞바꾼다.
+        i = hot[rng.randrange(len(hot))]
+        j = rng.randrange(n)
+        if i == j:
+            continue
+        a, b = pos[i], pos[j]
+
+        before = problem.local_cost(occ, a) + problem.local_cost(occ, b)
+        occ[a], occ[b] = j, i
+        after = problem.local_cost(occ, a) + problem.local_cost(occ, b)
+        delta = after - before
+
+        if delta <= 0 or rng.random() < math.exp(-delta / temp):
+            pos[i], pos[j] = b, a
+            cost += delta
+            if cost < best_cost - 1e-9:
+                best, best_cost = list(occ), cost
+                last_improved = it
+                if best_cost <= 1e-9:
+                    break
+        else:
+            occ[a], occ[b] = i, j
+
+    return best, max(best_cost, 0.0)
+
+
+def assign_seats_constrained(
+    df: pd.DataFrame,
+    rows: int,
+    bun_dan: int,
+    mode: str,
+    constraints: SeatingConstraints,
+    seed=None,
+    max_iters: int = 20000,
+    repeat=None,
+):
+    # (SeatMatrix, 못 지킨 조건 메시지 목록) 을 돌려준다.
+    # repeat: 학생×학생 짝 횟수 행렬 (자리 바꾸기 계획에서 같은 짝을 피할 때)
+    cols = bun_dan * 2 if mode == "Paired" else bun_dan
+    df = df.reset_index(drop=True)
+    n = min(len(df), rows * cols)
+    df = df.iloc[:n] if len(df) > n else df
+
+    rng = random.Random(seed)
+    order = list(range(len(df)))
+    rng.shuffle(order)
+
+    # 빈 자리는 원래 랜덤 배치처럼 뒤쪽에 두고, 학생끼리만 자리를 바꾼다.
+    occ = order + [-1] * (rows * cols - len(order))
+
+    if repeat is not None:
+        repeat = repeat[: len(df), : len(df)]
+    problem = _Problem(df, rows, cols, mode == "Paired", constraints, repeat)
+    occ, _ = _anneal(problem, occ, rng, max_iters)
+
+    table = seat_table(df)
+    matrix = SeatMatrix(np.asarray(occ, dtype=np.int32).reshape(rows, cols), table)
+
+    report = [f"명단에 없는 번호: {num}" for num in dict.fromkeys(problem.unknown)]
+    report += problem.violations(occ, table.labels)
+    return matrix, report
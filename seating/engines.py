@@ -0,0 +1,124 @@
+"""좌석 배치 엔진: 학생 명단 → SeatMatrix (앞줄이 0번 행)."""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from seating.metrics import timed
+from seating.roster import GENDER_ALIASES, clean_text
+from seating.seatmatrix import SeatMatrix, SeatTable
+
+SEAT_COLORS = {"여": "#F5B7B1", "남": "#A9CCE3"}  # 여학생 / 남학생
+UNKNOWN_GENDER_COLOR = "#e5e7eb"  # 기타/미지정
+
+
+# =========================================================
+# 1. 학생 dict → 좌석 표시용 dict
+# =========================================================
+def student_row_to_seat(row: pd.Series):
+    if row is None:
+        return None
+
+    gender = str(row.get("성별", "")).strip()
+    color = SEAT_COLORS.get(GENDER_ALIASES.get(gender), UNKNOWN_GENDER_COLOR)
+
+    num_str = str(row.get("출석 번호", "")).strip()
+    name_str = str(row.get("이름", "")).strip()
+    label = f"{num_str} {name_str}".strip()
+
+    return {"name": label, "color": color}
+
+
+# =========================================================
+# 2. 명단 전체를 한 번에 좌석 표시값으로 (벡터 연산)
+# =========================================================
+def _text_column(df: pd.DataFrame, name: str):
+    if name not in df.columns:
+        return pd.Series("", index=df.index)
+    return clean_text(df[name])
+
+
+def seat_labels_and_colors(df: pd.DataFrame):
+    # student_row_to_seat 와 같은 결과를 행 단위 반복 없이 컬럼 연산으로 계산한다.
+    labels = (_text_column(df, "출석 번호") + " " + _text_column(df, "이름")).str.strip()
+    colors = (
+        _text_column(df, "성별")
+        .map(GENDER_ALIASES)
+        .map(SEAT_COLORS)
+        .fillna(UNKNOWN_GENDER_COLOR)
+    )
+    return labels.tolist(), colors.tolist()
+
+
+def seat_table(df: pd.DataFrame):
+    labels, colors = seat_labels_and_colors(df)
+    return SeatTable(labels, colors)
+
+
+# =========================================================
+# 3. 랜덤 좌석 배치 로직
+# =========================================================
+@timed("assign_seats_random")
+def assign_seats_random(df: pd.DataFrame, rows: int, bun_dan: int, mode: str, seed=None):
+    # seed 가 같으면 (같은 명단·옵션에서) 항상 같은 배치가 나온다.
+    if mode == "Paired":
+        cols = bun_dan * 2  # 짝끼리 (0,1), (2,3) ... 열에 나란히 앉는다
+    else:
+        cols = bun_dan
+
+    order = np.random.default_rng(seed).permutation(len(df))  # 랜덤 섞기
+    return SeatMatrix.from_order(order, seat_table(df), rows, cols)
+
+
+# =========================================================
+# 4. 번호순 좌석 배치 로직
+# =========================================================
+@timed("assign_seats_by_number")
+def assign_seats_by_number(
+    df: pd.DataFrame, rows: int, bun_dan: int, sort_order: str, start_side: str
+):
+    # sort_order: "asc" or "desc"
+    # start_side: "left" or "right"
+    sort_key = pd.to_numeric(df["출석 번호"], errors="coerce").reset_index(drop=True)
+    order = sort_key.sort_values(ascending=(sort_order == "asc")).index
+
+    return SeatMatrix.from_order(order, seat_table(df), rows, bun_dan, start_side)
+
+
+# =========================================================
+# 5. 옵션 묶음 + 엔진 선택
+# =========================================================
+@dataclass(frozen=True)
+class LayoutOptions:
+    engine: str = "random"  # "random" (랜덤) / "number" (번호순)
+    rows: int = 6
+    bun_dan: int = 4
+    seating_mode: str = "Single"  # random 전용: "Single" / "Paired"
+    sort_order: str = "asc"  # number 전용
+    start_side: str = "left"  # number 전용
+
+    @property
+    def mode(self):
+        # 번호순 배치는 항상 혼자 앉기
+        return self.seating_mode if self.engine == "random" else "Single"
+
+    @property
+    def cols(self):
+        return self.bun_dan * 2 if self.mode == "Paired" else self.bun_dan
+
+    @property
+    def capacity(self):
+        return self.rows * self.cols
+
+
+def assign_seats(df: pd.DataFrame, options: LayoutOptions, seed=None):
+    if options.engine == "random":
+        return assign_seats_random(
+            df, options.rows, options.bun_dan, options.seating_mode, seed
+        )
+    if options.engine == "number":
+        return assign_seats_by_number(
+            df, options.rows, options.bun_dan, options.sort_order, options.start_side
+        )
+    raise ValueError(f"알 수 없는 배치 방식입니다: {options.engine}")
@@ -0,0 +1,233 @@
+"""시험실 배치: 학년 전체(여러 반)를 크기가 다른 여러 시험실에 나눠 앉힌다.
+
+- 시험실 목록(이름, 줄, 분단)은 엑셀/CSV 파일로 받는다.
+- 반별 명단을 번호순으로 정렬한 뒤, 자리를 한 번씩만 훑으면서(시험실 → 분단 → 앞에서 뒤로)
+  앞자리·옆자리와 다른 반 학생을 골라 앉힌다. 남은 인원이 많은 반을 먼저 고르므로
+  반 크기가 달라도 끝까지 고르게 섞인다.
+- 시험실마다 SeatMatrix 하나가 되고, 출력은 시험실별 페이지(PDF)와 시험실별 시트(엑셀)다.
+"""
+
+import io
+import os
+import zipfile
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from seating.batch import _render_class_pdf, class_titles, parallel_map
+from seating.engines import LayoutOptions, seat_table
+from seating.render.pdf_forms import build_form_pdf_document
+from seating.roster import clean_text
+from seating.seatmatrix import EMPTY, SeatMatrix
+
+ROOM_COLS = ["시험실", "줄", "분단"]
+
+
+class RoomSpecError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class ExamRoom:
+    name: str
+    rows: int
+    bun_dan: int
+
+    @property
+    def capacity(self):
+        return self.rows * self.bun_dan
+
+    @property
+    def options(self):
+        # 시험실은 항상 혼자 앉기 (번호순 배치와 같은 모양)
+        return LayoutOptions(engine="number", rows=self.rows, bun_dan=self.bun_dan)
+
+
+@dataclass
+class RoomLayout:
+    room: ExamRoom
+    roster: pd.DataFrame  # 이 시험실 학생 (반, 출석 번호, 이름, 성별). matrix 인덱스와 같은 순서
+    matrix: SeatMatrix
+    same_class_neighbors: int = 0  # 앞뒤·양옆으로 같은 반끼리 붙은 쌍 수
+
+
+# =========================================================
+# 1. 시험실 목록 읽기
+# =========================================================
+def normalize_room_spec(df: pd.DataFrame):
+    missing = [c for c in ROOM_COLS if c not in df.columns]
+    if missing:
+        raise RoomSpecError(f"시험실 목록에 {ROOM_COLS} 컬럼이 모두 있어야 합니다.")
+
+    df = df[ROOM_COLS].dropna(how="all")
+    rooms = []
+    for name, rows, bun_dan in zip(clean_text(df["시험실"]), df["줄"], df["분단"]):
+        try:
+            rows, bun_dan = int(rows), int(bun_dan)
+        except (TypeError, ValueError):
+            raise RoomSpecError(f"{name}: 줄/분단은 숫자여야 합니다.") from None
+        if not name or rows < 1 or bun_dan < 1:
+            raise RoomSpecError(f"시험실 이름과 1 이상의 줄/분단이 필요합니다: {name or '(이름 없음)'}")
+        rooms.append(ExamRoom(name, rows, bun_dan))
+
+    if not rooms:
+        raise RoomSpecError("시험실 목록이 비어 있습니다.")
+    if len({room.name for room in rooms}) != len(rooms):
+        raise RoomSpecError("시험실 이름이 겹칩니다.")
+    return rooms
+
+
+def read_room_spec(file_name: str, data: bytes):
+    ext = os.path.splitext(file_name)[1].lower()
+    try:
+        if ext in (".csv", ".txt"):
+            df = pd.read_csv(io.BytesIO(data), encoding="utf-8-sig")
+        else:
+            df = pd.read_excel(io.BytesIO(data))
+    except Exception as e:
+        raise RoomSpecError(f"시험실 목록을 읽을 수 없습니다: {e}") from None
+    return normalize_room_spec(df)
+
+
+# =========================================================
+# 2. 반을 섞어 시험실에 배치 (자리 한 번 훑기)
+# =========================================================
+def _grade_roster(classes):
+    # 반별 명단을 번호순으로 정렬해 하나로 이어 붙인다. starts[k]: k번째 반의 시작 위치
+    parts = []
+    for k, cls in enumerate(classes):
+        df = cls.roster
+        key = pd.to_numeric(df["출석 번호"], errors="coerce")
+        df = df.iloc[np.argsort(key.to_numpy(), kind="stable")]
+        parts.append(df.assign(반=cls.name))
+    grade = pd.concat(parts, ignore_index=True)[["반", "출석 번호", "이름", "성별"]]
+
+    sizes = np.array([len(p) for p in parts], dtype=np.int64)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    return grade, starts, sizes
+
+
+def _pick_class(remaining, strong, weak):
+    # 앞자리·옆자리(strong)와 대각선(weak) 반을 피하고, 남은 인원이 가장 많은 반을 고른다.
+    for avoid in (strong | weak, strong, set()):
+        best = -1
+        for k, left in enumerate(remaining):
+            if left and k not in avoid and (best < 0 or left > remaining[best]):
+                best = k
+        if best >= 0:
+            return best
+    return -1
+
+
+def allocate_exam_rooms(classes, rooms):
+    # classes: 명단이 있는 ClassLayout 목록, rooms: ExamRoom 목록 → RoomLayout 목록
+    classes = [cls for cls in classes if cls.ok and cls.roster is not None and len(cls.roster)]
+    grade, starts, sizes = _grade_roster(classes) if classes else (None, [], [])
+    total = int(sum(sizes))
+    capacity = sum(room.capacity for room in rooms)
+    if total > capacity:
+        raise RoomSpecError(f"시험실 자리가 부족합니다 (학생 {total}명 / 자리 {capacity}석)")
+
+    remaining = [int(s) for s in sizes]
+    taken = [0] * len(classes)
+
+    layouts = []
+    for room in rooms:
+        if not any(remaining):
+            break
+        rows, cols = room.rows, room.bun_dan
+        cls_grid = np.full((rows, cols), -1, dtype=np.int32)
+        picked = []  # grade 행 번호, 이 시험실에 앉은 순서
+        grid = np.full((rows, cols), EMPTY, dtype=np.int32)
+
+        # 시험 번호처럼 1분단 앞에서 뒤로, 다음 분단 ... 순서로 채운다.
+        for c in range(cols):
+            for r in range(rows):
+                strong, weak = set(), set()
+                if r > 0:
+                    strong.add(int(cls_grid[r - 1, c]))
+                if c > 0:
+                    strong.add(int(cls_grid[r, c - 1]))
+                    if r > 0:
+                        weak.add(int(cls_grid[r - 1, c - 1]))
+                    if r + 1 < rows:
+                        weak.add(int(cls_grid[r + 1, c - 1]))
+
+                k = _pick_class(remaining, strong, weak)
+                if k < 0:
+                    break
+                cls_grid[r, c] = k
+                grid[r, c] = len(picked)
+                picked.append(int(starts[k]) + taken[k])
+                taken[k] += 1
+                remaining[k] -= 1
+
+        roster = grade.iloc[picked].reset_index(drop=True)
+        # 시험실에는 여러 반이 섞이므로 좌석 이름에 반을 붙인다. (예: "2반 13 홍길동")
+        display = roster.assign(**{"출석 번호": roster["반"] + " " + roster["출석 번호"]})
+        matrix = SeatMatrix(grid, seat_table(display))
+
+        same = cls_grid >= 0
+        conflicts = int(
+            np.count_nonzero(same[1:, :] & same[:-1, :] & (cls_grid[1:, :] == cls_grid[:-1, :]))
+            + np.count_nonzero(same[:, 1:] & same[:, :-1] & (cls_grid[:, 1:] == cls_grid[:, :-1]))
+        )
+        layouts.append(RoomLayout(room, roster, matrix, conflicts))
+    return layouts
+
+
+# =========================================================
+# 3. 출력 (시험실별 PDF 는 병렬로)
+# =========================================================
+def render_rooms_merged_pdf(layouts):
+    sections = []
+    for layout in layouts:
+        teacher_title, student_title = class_titles(layout.room.name)
+        pages = [("teacher", teacher_title), ("student", student_title)]
+        sections.append((layout.matrix, "Single", layout.room.bun_dan, pages))
+    return build_form_pdf_document(sections)
+
+
+def render_room_pdfs(layouts, workers: int | None = None):
+    # [(시험실 이름, PDF bytes), ...] — 여러 반 한 번에와 같은 프로세스 풀 작업자를 쓴다.
+    jobs = [(layout.room.name, layout.matrix, layout.room.options) for layout in layouts]
+    return parallel_map(_render_class_pdf, jobs, workers)
+
+
+def render_rooms_zip(layouts, workers: int | None = None):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, pdf in render_room_pdfs(layouts, workers):
+            zf.writestr(f"{name.replace('/', '_')}.pdf", pdf)
+    return buf.getvalue()
+
+
+def room_assignment_workbook(layouts):
+    # 시험실마다 시트 하나: 분단 | 줄 | 반 | 출석 번호 | 이름
+    buf = io.BytesIO()
+    used = set()
+    with pd.ExcelWriter(buf, engine="openpyxl") as writer:
+        for layout in layouts:
+            rr, cc = np.nonzero(layout.matrix.grid != EMPTY)
+            idx = layout.matrix.grid[rr, cc]
+            sheet = layout.roster.iloc[idx][["반", "출석 번호", "이름"]].reset_index(drop=True)
+            sheet.insert(0, "줄", rr + 1)
+            sheet.insert(0, "분단", cc + 1)
+            sheet = sheet.sort_values(["분단", "줄"], kind="stable")
+            sheet_name = _unique_sheet_name(layout.room.name, used)
+            sheet.to_excel(writer, sheet_name=sheet_name, index=False)
+    return buf.getvalue()
+
+
+def _unique_sheet_name(name: str, used: set):
+    # 엑셀 시트 이름은 31자까지, 일부 특수문자 금지, 대소문자 구분 없이 겹치면 안 된다.
+    # 자르거나 바꾼 뒤 겹치면 끝에 _2, _3 … 을 붙인다 (붙인 뒤에도 31자 안).
+    base = "".join("_" if ch in "[]:*?/\\" else ch for ch in name).strip("'") or "시험실"
+    sheet_name, n = base[:31], 1
+    while sheet_name.casefold() in used:
+        n += 1
+        suffix = f"_{n}"
+        sheet_name = base[: 31 - len(suffix)] + suffix
+    used.add(sheet_name.casefold())
+    return sheet_name
@@ -0,0 +1,91 @@
+"""PDF용 한글 폰트(MaruBuri)를 서버 프로세스당 한 번만 찾아서 등록한다."""
+
+import os
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+from seating.metrics import timed
+
+# =========================================================
+# 0. 폰트 후보 경로
+# =========================================================
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+KOREAN_FONT_NAME = "MaruBuri"
+FALLBACK_FONT_NAME = "Helvetica"
+
+# 실제 폰트는 ponts/ 에 있고, fonts/ 쪽은 1바이트짜리 빈 파일이라 검증에서 걸러진다.
+FONT_CANDIDATES = [
+    os.path.join(ROOT_DIR, "ponts", "MaruBuri-Regular.ttf"),
+    os.path.join(ROOT_DIR, "fonts", "MaruBuri-Regular.ttf"),
+    os.path.join(ROOT_DIR, "fonts", "MaruBuri-Regular.otf"),
+    os.path.join(ROOT_DIR, "MaruBuri-Regular.ttf"),
+]
+
+# TrueType / OpenType 파일 시그니처
+_FONT_MAGICS = (b"\x00\x01\x00\x00", b"true", b"OTTO", b"ttcf")
+_MIN_FONT_BYTES = 1024
+
+_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class FontHandle:
+    name: str  # reportlab 에 등록된 폰트 이름 (setFont 에 그대로 사용)
+    path: str | None = None  # 실제로 읽은 파일 (대체 폰트면 None)
+    ttfont: TTFont | None = None
+    skipped: tuple = ()  # (경로, 사유) 목록
+
+    @property
+    def is_fallback(self):
+        return self.ttfont is None
+
+    def describe(self):
+        if self.is_fallback:
+            return f"{self.name} (한글 폰트를 찾지 못해 대체 폰트 사용)"
+        return f"{self.name} ({os.path.relpath(self.path, ROOT_DIR)})"
+
+
+# =========================================================
+# 1. 폰트 파일 검증
+# =========================================================
+def check_font_file(path: str):
+    # 문제가 없으면 None, 있으면 사유 문자열을 돌려준다.
+    if not os.path.isfile(path):
+        return "파일 없음"
+    if os.path.getsize(path) < _MIN_FONT_BYTES:
+        return f"파일 크기가 너무 작음 ({os.path.getsize(path)} bytes)"
+    with open(path, "rb") as f:
+        magic = f.read(4)
+    if magic not in _FONT_MAGICS:
+        return "TrueType/OpenType 파일이 아님"
+    return None
+
+
+# =========================================================
+# 2. 프로세스 단위 1회 로딩
+# =========================================================
+@lru_cache(maxsize=None)
+@timed("font_load")  # lru_cache 안쪽이라 처음 한 번만 기록된다
+def load_korean_font():
+    # Streamlit 은 위젯을 누를 때마다 페이지 스크립트를 다시 실행하므로
+    # 폰트 파싱은 여기서 프로세스당 한 번만 하고 결과 핸들을 재사용한다.
+    with _lock:
+        skipped = []
+        for path in FONT_CANDIDATES:
+            reason = check_font_file(path)
+            if reason is None:
+                try:
+                    ttfont = TTFont(KOREAN_FONT_NAME, path)
+                except Exception as e:
+                    reason = f"폰트 파싱 실패: {e}"
+                else:
+                    pdfmetrics.registerFont(ttfont)
+                    return FontHandle(KOREAN_FONT_NAME, path, ttfont, tuple(skipped))
+            skipped.append((path, reason))
+
+        return FontHandle(FALLBACK_FONT_NAME, None, None, tuple(skipped))
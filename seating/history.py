@@ -0,0 +1,173 @@
+"""랜덤 배치 기록: (명단 해시, 옵션, 시드) 만 있으면 같은 배치를 다시 만들 수 있다."""
+
+import base64
+import json
+import secrets
+import time
+from dataclasses import asdict, dataclass, field
+
+import pandas as pd
+
+from seating.cache import TieredCache, content_key
+from seating.constraints import SeatingConstraints, assign_seats_constrained
+from seating.engines import LayoutOptions, assign_seats, seat_table
+from seating.metrics import register_cache, timed
+from seating.roster import roster_digest
+from seating.seatmatrix import SeatMatrix
+
+HISTORY_VERSION = 1
+
+
+def new_seed():
+    return secrets.randbelow(2**31)
+
+
+# =========================================================
+# 1. 시드로 배치 만들기 / 되살리기
+# =========================================================
+def _encode_layout(item):
+    # (SeatMatrix.to_bytes(), 못 지킨 조건) → 조건 목록 JSON 한 줄 + 격자 bytes
+    layout, unmet = item
+    return json.dumps(list(unmet)).encode("utf-8") + b"\n" + layout
+
+
+def _decode_layout(data: bytes):
+    head, layout = data.split(b"\n", 1)
+    return layout, tuple(json.loads(head))
+
+
+# (명단, 옵션, 시드, 조건) → 배치 격자. 같은 배치를 다시 부르면 (다른 세션·재시작 뒤에도) 바로 복원한다.
+LAYOUT_CACHE = register_cache(
+    "layout",
+    TieredCache(
+        "layout",
+        max_entries=1024,
+        max_bytes=16 * 1024 * 1024,
+        sizeof=lambda item: len(item[0]),
+        encode=_encode_layout,
+        decode=_decode_layout,
+    ),
+)
+
+
+def _assign(df, options, seed, constraints):
+    if options.engine == "random" and constraints is not None and not constraints.is_empty():
+        return assign_seats_constrained(
+            df, options.rows, options.bun_dan, options.seating_mode, constraints, seed=seed
+        )
+    return assign_seats(df, options, seed), []
+
+
+@timed("build_layout")
+def build_layout(df: pd.DataFrame, options: LayoutOptions, seed, constraints=None):
+    # (SeatMatrix, 못 지킨 조건 목록). 조건이 있으면 조건 배치 엔진을 쓴다.
+    if seed is None:
+        return _assign(df, options, seed, constraints)  # 매번 다른 배치는 캐시하지 않는다
+
+    key = content_key(
+        "layout",
+        roster_digest(df),
+        asdict(options),
+        seed,
+        asdict(constraints) if constraints is not None and not constraints.is_empty() else None,
+    )
+    item = LAYOUT_CACHE.get(key)
+    if item is not None:
+        return SeatMatrix.from_bytes(item[0], seat_table(df)), list(item[1])
+
+    matrix, unmet = _assign(df, options, seed, constraints)
+    LAYOUT_CACHE.put(key, (matrix.to_bytes(), tuple(unmet)))
+    return matrix, unmet
+
+
+@dataclass
+class HistoryEntry:
+    roster: str  # roster_digest
+    options: LayoutOptions
+    seed: int
+    constraints: SeatingConstraints | None = None
+    created: float = field(default_factory=time.time)
+    layout: bytes = b""  # SeatMatrix.to_bytes(): 다시 배치하지 않고 바로 복원할 때 사용
+    unmet: tuple = ()
+    note: str = ""  # 예: "직접 수정" — 시드로 다시 만들면 나오지 않는 배치
+
+    def label(self):
+        mode = "짝" if self.options.mode == "Paired" else "혼자"
+        when = time.strftime("%H:%M:%S", time.localtime(self.created))
+        label = f"{when} · {mode} {self.options.bun_dan}분단×{self.options.rows}줄 · 시드 {self.seed}"
+        return f"{label} · {self.note}" if self.note else label
+
+    def restore(self, df: pd.DataFrame):
+        if self.layout:
+            return SeatMatrix.from_bytes(self.layout, seat_table(df))
+        return build_layout(df, self.options, self.seed, self.constraints)[0]
+
+    def to_dict(self):
+        return {
+            "roster": self.roster,
+            "options": asdict(self.options),
+            "seed": self.seed,
+            "constraints": asdict(self.constraints) if self.constraints else None,
+            "created": self.created,
+            # 직접 수정·명단 변경 반영처럼 시드로는 다시 나오지 않는 배치도 그대로 되살리도록 격자를 함께 담는다.
+            "layout": base64.b64encode(self.layout).decode("ascii"),
+            "unmet": list(self.unmet),
+            "note": self.note,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        constraints = data.get("constraints")
+        if constraints:
+            constraints = SeatingConstraints(
+                apart=[tuple(p) for p in constraints.get("apart", [])],
+                front=list(constraints.get("front", [])),
+                front_rows=constraints.get("front_rows", 2),
+                mixed_gender_pairs=constraints.get("mixed_gender_pairs", False),
+                previous_partners=[tuple(p) for p in constraints.get("previous_partners", [])],
+            )
+        return cls(
+            roster=data["roster"],
+            options=LayoutOptions(**data["options"]),
+            seed=int(data["seed"]),
+            constraints=constraints or None,
+            created=data.get("created", time.time()),
+            layout=base64.b64decode(data.get("layout") or ""),
+            unmet=tuple(data.get("unmet", ())),
+            note=data.get("note", ""),
+        )
+
+
+# =========================================================
+# 2. 세션별 기록
+# =========================================================
+class LayoutHistory:
+    def __init__(self, max_entries: int = 20):
+        self.max_entries = max_entries
+        self.entries = []
+        self.current = None
+
+    def add(self, entry: HistoryEntry):
+        self.entries.append(entry)
+        if len(self.entries) > self.max_entries:
+            del self.entries[: len(self.entries) - self.max_entries]
+        self.current = entry
+        return entry
+
+    def for_roster(self, roster: str):
+        return [e for e in self.entries if e.roster == roster]
+
+    def export_json(self, roster: str | None = None):
+        entries = self.entries if roster is None else self.for_roster(roster)
+        return json.dumps(
+            {"version": HISTORY_VERSION, "entries": [e.to_dict() for e in entries]},
+            ensure_ascii=False,
+            indent=2,
+        )
+
+
+def load_history_json(text: str):
+    data = json.loads(text)
+    if data.get("version") != HISTORY_VERSION:
+        raise ValueError("지원하지 않는 배치 기록 파일입니다.")
+    return [HistoryEntry.from_dict(e) for e in data.get("entries", [])]
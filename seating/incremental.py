@@ -0,0 +1,120 @@
+"""명단이 조금 바뀌었을 때 (전학 등) 기존 배치에서 바뀐 학생 자리만 고친다.
+
+출석 번호로 이전/새 명단을 비교해서
+- 나간 학생 자리는 빈 자리로,
+- 새로 온 학생은 빈 자리에 (번호순 배치는 마지막 학생 다음 자리부터),
+- 이름/성별만 바뀐 학생은 자리 그대로 표시만 바꾼다.
+나머지 학생은 자리를 옮기지 않는다.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from seating.engines import seat_table
+from seating.roster import RosterError
+from seating.seatmatrix import EMPTY, SeatMatrix
+
+
+@dataclass
+class RosterDiff:
+    added: list  # 새 명단의 행 번호
+    removed: list  # 이전 명단의 행 번호
+    changed: list  # 이름/성별이 바뀐 학생의 새 명단 행 번호
+    old_to_new: np.ndarray  # 이전 행 번호 → 새 행 번호 (나간 학생은 -1)
+
+    def is_empty(self):
+        return not (self.added or self.removed or self.changed)
+
+    def summary(self):
+        parts = []
+        if self.added:
+            parts.append(f"새로 온 학생 {len(self.added)}명")
+        if self.removed:
+            parts.append(f"나간 학생 {len(self.removed)}명")
+        if self.changed:
+            parts.append(f"정보가 바뀐 학생 {len(self.changed)}명")
+        return ", ".join(parts) or "바뀐 학생 없음"
+
+
+# =========================================================
+# 1. 명단 비교 (출석 번호 기준)
+# =========================================================
+def diff_rosters(old_df: pd.DataFrame, new_df: pd.DataFrame):
+    old_num = old_df["출석 번호"].astype(str).reset_index(drop=True)
+    new_num = new_df["출석 번호"].astype(str).reset_index(drop=True)
+    if old_num.duplicated().any() or new_num.duplicated().any():
+        raise RosterError("출석 번호가 겹치는 학생이 있어 바뀐 학생을 찾을 수 없습니다.")
+
+    new_pos = pd.Series(np.arange(len(new_num)), index=new_num)
+    old_to_new = new_pos.reindex(old_num).fillna(-1).astype(np.int64).to_numpy()
+
+    kept = old_to_new >= 0
+    removed = np.flatnonzero(~kept).tolist()
+    added = np.setdiff1d(np.arange(len(new_num)), old_to_new[kept]).tolist()
+
+    cols = ["이름", "성별"]
+    old_info = old_df[cols].reset_index(drop=True).iloc[np.flatnonzero(kept)]
+    new_info = new_df[cols].reset_index(drop=True).iloc[old_to_new[kept]]
+    differs = (old_info.to_numpy() != new_info.to_numpy()).any(axis=1)
+    changed = old_to_new[kept][differs].tolist()
+
+    return RosterDiff(added, removed, changed, old_to_new)
+
+
+# =========================================================
+# 2. 기존 배치에 반영
+# =========================================================
+def _fill_order(rows: int, cols: int, start_side: str):
+    # 배치 엔진이 자리를 채우는 순서 (앞줄부터, 시작 위치 쪽부터) 의 평평한 자리 번호
+    order = np.arange(rows * cols).reshape(rows, cols)
+    if start_side == "right":
+        order = order[:, ::-1]
+    return order.ravel()
+
+
+def apply_roster_diff(
+    matrix: SeatMatrix, new_df: pd.DataFrame, diff: RosterDiff, engine="random", start_side="left"
+):
+    # (새 SeatMatrix, 바뀐 자리 [(행, 열), ...]) 를 돌려준다.
+    old_grid = matrix.grid
+    grid = np.where(old_grid != EMPTY, diff.old_to_new[np.maximum(old_grid, 0)], EMPTY)
+    grid = grid.astype(np.int32)
+
+    flat = grid.ravel()
+    order = _fill_order(matrix.rows, matrix.cols, start_side)
+    empty = order[flat[order] == EMPTY]
+
+    added = list(diff.added)
+    if engine == "number":
+        # 번호 순서를 지키도록 새로 온 학생은 번호순으로, 마지막 학생 다음 자리부터 앉힌다.
+        key = pd.to_numeric(new_df["출석 번호"].iloc[added], errors="coerce").to_numpy()
+        added = [added[i] for i in np.argsort(key, kind="stable")]
+        occupied = np.flatnonzero(flat[order] != EMPTY)
+        last = occupied[-1] if len(occupied) else -1
+        after = order[last + 1 :]
+        empty = np.concatenate([after, empty[~np.isin(empty, after)]])
+
+    if len(added) > len(empty):
+        raise RosterError(
+            f"좌석이 부족합니다 (새로 온 학생 {len(added)}명 / 빈 자리 {len(empty)}석)"
+        )
+    flat[empty[: len(added)]] = added
+
+    new_matrix = SeatMatrix(flat.reshape(matrix.shape), seat_table(new_df.reset_index(drop=True)))
+    return new_matrix, changed_seats(matrix, new_matrix)
+
+
+def changed_seats(old: SeatMatrix, new: SeatMatrix):
+    # 화면/PDF 에서 달라 보이는 칸 (이름이나 색이 바뀐 자리)
+    def shown(matrix):
+        labels = np.array([""] + matrix.table.labels, dtype=object)
+        colors = np.array([""] + matrix.table.colors, dtype=object)
+        idx = matrix.grid + 1  # EMPTY(-1) → 0 번 "빈 자리"
+        return labels[idx], colors[idx]
+
+    old_labels, old_colors = shown(old)
+    new_labels, new_colors = shown(new)
+    rr, cc = np.nonzero((old_labels != new_labels) | (old_colors != new_colors))
+    return list(zip(rr.tolist(), cc.tolist()))
@@ -0,0 +1,177 @@
+"""무거운 결과물(PDF)을 백그라운드에서 만드는 작업 큐.
+
+페이지 스크립트는 작업을 넣기만 하고 바로 다음 줄로 넘어간다. 결과는 프로세스 공용
+캐시(PDF_CACHE 등)에 들어가므로, 다른 세션이 같은 배치를 요청하면 이미 끝난 결과를
+그대로 쓰거나 진행 중인 같은 작업을 기다린다 (같은 작업을 두 번 만들지 않는다).
+
+CPU 가 여럿이면 batch 의 작업자 프로세스 풀에서 그려서 ReportLab 이 서버의 GIL 을
+붙잡지 않게 하고, 하나뿐이면 스레드 하나에서 차례로 만든다.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+
+from seating.batch import get_process_pool
+from seating.cache import PDF_CACHE
+from seating.metrics import observe, register_queue
+from seating.render.pdf import page_ops, pdf_from_ops, pdf_pages_key
+
+FAILED_KEEP = 64  # 실패한 작업을 (오류를 보여 주려고) 들고 있는 최대 개수
+
+
+@dataclass
+class Job:
+    key: str
+    label: str
+    future: Future = field(repr=False)
+
+    @property
+    def done(self):
+        return self.future.done()
+
+    @property
+    def error(self):
+        # 실패했으면 예외, 아직이거나 성공했으면 None
+        if not self.future.done():
+            return None
+        if self.future.cancelled():
+            return CancelledError("작업이 취소되었습니다.")
+        return self.future.exception()
+
+    def result(self, timeout=None):
+        return self.future.result(timeout)
+
+
+def _finished(value):
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+class JobQueue:
+    def __init__(self, cache, workers: int | None = None, stage: str = "job"):
+        self.cache = cache
+        self.stage = stage  # 지표 이름: 넣은 뒤 끝날 때까지 (기다린 시간 포함)
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self._executor = None
+        self._inflight = {}  # key -> Job (아직 끝나지 않은 작업)
+        # key -> Job (실패한 작업). 다시 그려도 오류가 보이도록 두었다가, 다시 넣으면 지운다.
+        self._failed = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.submitted = 0
+        self.deduped = 0  # 진행 중인 같은 작업에 붙은 횟수
+        self.cached = 0  # 이미 캐시에 있어서 바로 끝난 횟수
+        self.failed = 0
+
+    def _get_executor(self):
+        if self.workers > 1:
+            # 작업자 프로세스는 여러 반 PDF 를 만들 때 쓰는 풀과 같이 쓴다.
+            return get_process_pool(self.workers)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="render-job")
+        return self._executor
+
+    def _lookup(self, key, label, count=True):
+        # 캐시에 있거나 진행 중인 같은 작업 (lock 안에서 부른다)
+        # count=False 면 메모리 캐시만 통계 없이 들여다본다 (디스크·적중률을 건드리지 않는다).
+        value = self.cache.get(key) if count else self.cache.peek(key)
+        if value is not None:
+            if count:
+                self.cached += 1
+            return Job(key, label, _finished(value))
+        job = self._inflight.get(key)
+        if job is not None:
+            if count:
+                self.deduped += 1
+            return job
+        return self._failed.get(key)
+
+    def find(self, key, label=""):
+        # 상태 확인용: 화면을 다시 그릴 때마다(주기적 갱신 포함) 부르므로 어떤 통계도 세지 않는다.
+        with self._lock:
+            return self._lookup(key, label, count=False)
+
+    def submit(self, key, label, func, *args):
+        # func(*args) 의 결과를 key 로 캐시에 넣는 작업. 프로세스 풀에서 돌 수 있으므로
+        # func 와 args 는 pickle 가능해야 한다 (모듈 최상위 함수).
+        # 전에 실패한 작업이 있으면 사용자가 다시 만들기를 누른 것이므로 지우고 새로 넣는다.
+        with self._lock:
+            self._failed.pop(key, None)
+            job = self._lookup(key, label)
+            if job is not None:
+                return job
+            try:
+                future = self._get_executor().submit(func, *args)
+            except BrokenProcessPool:
+                # 받은 풀이 그 사이에 깨졌으면 한 번 더 받는다 (get_process_pool 이 새로 만든다)
+                future = self._get_executor().submit(func, *args)
+            job = Job(key, label, future)
+            self._inflight[key] = job
+            self.submitted += 1
+
+        start = time.perf_counter()
+        job.future.add_done_callback(lambda future: self._finish(key, future, start))
+        return job
+
+    def _finish(self, key, future, start):
+        observe(self.stage, time.perf_counter() - start)
+        failed = future.cancelled() or future.exception() is not None
+        if not failed:
+            # 캐시에 먼저 넣고 나서 진행 중 목록에서 뺀다. 반대 순서면 그 사이에 들어온
+            # submit 이 둘 다 못 찾고 같은 작업을 한 번 더 만든다.
+            self.cache.put(key, future.result())
+        with self._lock:
+            job = self._inflight.pop(key, None)
+            if failed:
+                self.failed += 1
+                if job is not None:
+                    self._failed[key] = job
+                    while len(self._failed) > FAILED_KEEP:
+                        self._failed.popitem(last=False)
+
+    def running(self):
+        with self._lock:
+            return len(self._inflight)
+
+    def stats(self):
+        return {
+            "running": self.running(),
+            "submitted": self.submitted,
+            "deduped": self.deduped,
+            "cached": self.cached,
+            "failed": self.failed,
+        }
+
+
+def progress(jobs):
+    # (끝난 작업 수, 전체 작업 수)
+    jobs = list(jobs)
+    return sum(job.done for job in jobs), len(jobs)
+
+
+# 서버 프로세스 공용 PDF 작업 큐
+PDF_JOBS = register_queue("pdf", JobQueue(PDF_CACHE, stage="pdf_job"))
+
+
+def find_pdf(matrix, seating_mode, bun_dan, pages, label=""):
+    # 이미 만들었거나 만드는 중이거나 실패한 PDF 작업. 아무도 요청하지 않았으면 None (새로 만들지 않는다)
+    key = pdf_pages_key(matrix, seating_mode, bun_dan, pages)
+    return PDF_JOBS.find(key, label)
+
+
+def submit_pdf(matrix, seating_mode, bun_dan, pages, label=""):
+    # make_pdf_pages 와 같은 키로 캐시에 넣으므로 나중에 직접 부르는 쪽도 그대로 재사용한다.
+    pages = [tuple(p) for p in pages]
+    key = pdf_pages_key(matrix, seating_mode, bun_dan, pages)
+    job = PDF_JOBS.find(key, label)
+    if job is not None and job.error is None:
+        return job
+    # 페이지 명령은 여기(서버 프로세스)서 계산해 넘긴다 — 명단 변경 때 고쳐 둔 페이지도 그대로 쓰인다.
+    pages_ops = [page_ops(matrix, seating_mode, v, bun_dan, t) for v, t in pages]
+    return PDF_JOBS.submit(key, label, pdf_from_ops, pages_ops)
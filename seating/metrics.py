@@ -0,0 +1,270 @@
+"""단계별 소요 시간 히스토그램과 캐시 적중률 (서버 프로세스 공용, 모든 세션 합산).
+
+    with timed("read_excel"):
+        ...
+
+    @timed("render_chart")
+    def render_chart(...): ...
+
+관리자 페이지(pages/99_관리자_지표.py)에서 표로 보거나, Prometheus 텍스트 형식으로
+내보낼 수 있다. 환경 변수 SEATING_METRICS_PORT 가 있으면 그 포트의 /metrics 로도 연다.
+이 모듈은 seating 의 다른 모듈을 import 하지 않는다 (어디서든 가져다 쓰도록).
+"""
+
+import functools
+import http.server
+import math
+import os
+import threading
+import time
+
+# 초 단위 버킷 상한 (Prometheus 기본값과 비슷하게, 마지막은 +Inf)
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, math.inf)
+
+
+# =========================================================
+# 1. 히스토그램
+# =========================================================
+class Histogram:
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)  # 버킷별 (누적 아님)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        i = next(i for i, upper in enumerate(self.buckets) if seconds <= upper)
+        with self._lock:
+            self.counts[i] += 1
+            self.count += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+
+    def quantile(self, q: float):
+        # 버킷 상한으로 어림한 분위수 (+Inf 버킷이면 최댓값)
+        with self._lock:
+            if self.count == 0:
+                return None
+            target = q * self.count
+            seen = 0
+            for upper, n in zip(self.buckets, self.counts):
+                seen += n
+                if seen >= target:
+                    return min(upper, self.max)
+            return self.max
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "count": self.count,
+                "sum": self.total,
+                "max": self.max,
+                "counts": list(self.counts),
+            }
+
+
+_stages = {}
+_stages_lock = threading.Lock()
+
+
+def histogram(stage: str):
+    with _stages_lock:
+        hist = _stages.get(stage)
+        if hist is None:
+            hist = _stages[stage] = Histogram()
+        return hist
+
+
+def observe(stage: str, seconds: float):
+    histogram(stage).observe(seconds)
+
+
+class timed:
+    # 컨텍스트 매니저로도, 데코레이터로도 쓴다. 예외가 나도 걸린 시간은 기록한다.
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        observe(self.stage, time.perf_counter() - self._start)
+        return False
+
+    def __call__(self, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timed(self.stage):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+
+def stage_table():
+    # [(단계, 횟수, 평균 초, p50, p95, 최댓값, 합계), ...] 합계가 큰 순서
+    with _stages_lock:
+        items = list(_stages.items())
+    rows = []
+    for stage, hist in items:
+        snap = hist.snapshot()
+        if snap["count"] == 0:
+            continue
+        rows.append(
+            (
+                stage,
+                snap["count"],
+                snap["sum"] / snap["count"],
+                hist.quantile(0.5),
+                hist.quantile(0.95),
+                snap["max"],
+                snap["sum"],
+            )
+        )
+    rows.sort(key=lambda row: row[-1], reverse=True)
+    return rows
+
+
+# =========================================================
+# 2. 캐시 / 작업 큐 등록
+# =========================================================
+_caches = {}  # 이름 -> LRUCache 또는 functools.lru_cache 함수
+_queues = {}  # 이름 -> JobQueue
+
+
+def register_cache(name: str, cache):
+    _caches[name] = cache
+    return cache
+
+
+def register_queue(name: str, queue):
+    _queues[name] = queue
+    return queue
+
+
+def cache_stats():
+    # {이름: {"entries", "bytes", "hits", "misses", "evictions"[, "disk_hits"]}}
+    stats = {}
+    for name, cache in sorted(_caches.items()):
+        if hasattr(cache, "stats"):
+            stats[name] = cache.stats()
+        else:
+            info = cache.cache_info()
+            stats[name] = {
+                "entries": info.currsize,
+                "bytes": None,
+                "hits": info.hits,
+                "misses": info.misses,
+                "evictions": None,
+            }
+    return stats
+
+
+def queue_stats():
+    return {name: queue.stats() for name, queue in sorted(_queues.items())}
+
+
+def reset():
+    with _stages_lock:
+        _stages.clear()
+
+
+# =========================================================
+# 3. Prometheus 텍스트 형식
+# =========================================================
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _le(upper):
+    return "+Inf" if math.isinf(upper) else repr(upper)
+
+
+def prometheus_text():
+    lines = [
+        "# HELP seating_stage_seconds 단계별 소요 시간",
+        "# TYPE seating_stage_seconds histogram",
+    ]
+    with _stages_lock:
+        items = sorted(_stages.items())
+    for stage, hist in items:
+        snap = hist.snapshot()
+        label = _label(stage)
+        cumulative = 0
+        for upper, n in zip(hist.buckets, snap["counts"]):
+            cumulative += n
+            lines.append(f'seating_stage_seconds_bucket{{stage="{label}",le="{_le(upper)}"}} {cumulative}')
+        lines.append(f'seating_stage_seconds_sum{{stage="{label}"}} {snap["sum"]}')
+        lines.append(f'seating_stage_seconds_count{{stage="{label}"}} {snap["count"]}')
+
+    caches = cache_stats()
+    for field, kind, help_text in (
+        ("hits", "counter", "캐시 적중 수"),
+        ("misses", "counter", "캐시 실패 수"),
+        ("disk_hits", "counter", "메모리에 없어 디스크 보관함에서 찾은 수"),
+        ("evictions", "counter", "캐시에서 밀려난 항목 수"),
+        ("entries", "gauge", "캐시 항목 수"),
+        ("bytes", "gauge", "캐시 크기 (bytes)"),
+    ):
+        metric = f"seating_cache_{field}_total" if kind == "counter" else f"seating_cache_{field}"
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for name, stats in caches.items():
+            if stats.get(field) is not None:
+                lines.append(f'{metric}{{cache="{_label(name)}"}} {stats[field]}')
+
+    queues = queue_stats()
+    fields = sorted({field for stats in queues.values() for field in stats})
+    for field in fields:
+        kind = "gauge" if field == "running" else "counter"
+        metric = f"seating_jobs_{field}" if kind == "gauge" else f"seating_jobs_{field}_total"
+        lines.append(f"# TYPE {metric} {kind}")
+        for name, stats in queues.items():
+            lines.append(f'{metric}{{queue="{_label(name)}"}} {stats.get(field, 0)}')
+    return "\n".join(lines) + "\n"
+
+
+# =========================================================
+# 4. /metrics 엔드포인트 (선택)
+# =========================================================
+class _MetricsHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = prometheus_text().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # 요청마다 stderr 에 찍지 않는다
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(port: int, host: str = "127.0.0.1"):
+    # 프로세스당 한 번만 띄운다. 이미 떠 있으면 그 서버를 돌려준다.
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = http.server.ThreadingHTTPServer((host, port), _MetricsHandler)
+            thread = threading.Thread(target=_server.serve_forever, name="metrics", daemon=True)
+            thread.start()
+        return _server
+
+
+def maybe_start_metrics_server():
+    port = os.environ.get("SEATING_METRICS_PORT")
+    if not port:
+        return None
+    try:
+        return start_metrics_server(int(port), os.environ.get("SEATING_METRICS_HOST", "127.0.0.1"))
+    except (OSError, ValueError):
+        return None  # 포트를 못 열어도 앱은 그대로 돈다
@@ -0,0 +1,40 @@
+"""좌석표 출력 백엔드 모음."""
+
+from seating.render.base import STUDENT_TITLE, TEACHER_TITLE, Renderer
+from seating.render.html import HtmlRenderer
+from seating.render.pdf import PdfRenderer
+from seating.render.pdf_forms import FormPdfRenderer
+from seating.render.png import PngRenderer
+from seating.render.print_html import PrintHtmlRenderer
+from seating.render.svg import SvgRenderer
+
+RENDERERS = {
+    "pdf": PdfRenderer(),
+    "html": HtmlRenderer(),
+    "pdf-form": FormPdfRenderer(),
+    "svg": SvgRenderer(),
+    "png": PngRenderer(),
+    "print-html": PrintHtmlRenderer(),
+}
+
+
+def get_renderer(name: str):
+    try:
+        return RENDERERS[name]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 출력 형식입니다: {name}") from None
+
+
+__all__ = [
+    "RENDERERS",
+    "STUDENT_TITLE",
+    "TEACHER_TITLE",
+    "FormPdfRenderer",
+    "HtmlRenderer",
+    "PdfRenderer",
+    "PngRenderer",
+    "PrintHtmlRenderer",
+    "Renderer",
+    "SvgRenderer",
+    "get_renderer",
+]
@@ -0,0 +1,26 @@
+"""좌석표 렌더러 공통 인터페이스."""
+
+TEACHER_TITLE = "교사용 좌석 배치표"
+STUDENT_TITLE = "학생용 좌석 배치표"
+
+
+class Renderer:
+    # 좌석 행렬 하나를 특정 형식(PDF, HTML ...)의 결과물로 바꾼다.
+    # pages 는 [(view_mode, title), ...] 이고 view_mode 는 "teacher" / "student".
+    name = ""
+    mime = ""
+    extension = ""
+
+    def render(self, matrix, seating_mode, bun_dan, pages):
+        raise NotImplementedError
+
+    def render_both(
+        self,
+        matrix,
+        seating_mode,
+        bun_dan,
+        teacher_title=TEACHER_TITLE,
+        student_title=STUDENT_TITLE,
+    ):
+        pages = [("teacher", teacher_title), ("student", student_title)]
+        return self.render(matrix, seating_mode, bun_dan, pages)
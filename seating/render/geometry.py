@@ -0,0 +1,145 @@
+"""출력 형식과 상관없는 좌석표 페이지 배치 (A4 가로, 단위 pt, 원점은 왼쪽 아래).
+
+PDF 는 여기서 계산한 위치로 canvas 명령을 만들고, SVG/PNG/인쇄용 HTML 은
+layout_scene() 이 돌려주는 도형 목록을 각자 형식으로 옮기기만 한다.
+"""
+
+from reportlab.lib.pagesizes import A4, landscape
+
+from seating.cache import PAGE_CACHE, content_key
+from seating.fonts import load_korean_font
+from seating.render.textfit import BASELINE, LEADING, fit_empty, fit_table
+from seating.seatmatrix import EMPTY
+
+PAGE_WIDTH, PAGE_HEIGHT = landscape(A4)
+
+TITLE_SIZE = 26
+PODIUM_SIZE = 18
+EMPTY_FILL = "#e0e7ff"
+EMPTY_STROKE = "#d1d5db"
+PODIUM_FILL = "#eff6ff"
+PODIUM_COLOR = "#2563eb"
+TEXT_COLOR = "#000000"
+
+
+# =========================================================
+# 1. 칸 크기 / 위치
+# =========================================================
+def page_geometry(rows, cols, seating_mode, view_mode, bun_dan):
+    width, height = PAGE_WIDTH, PAGE_HEIGHT
+
+    margin_y = 80
+    gap_x = 10
+    gap_y = 18
+    pair_gap = 22 if seating_mode == "Paired" else 0
+
+    # 2) 제목 위치
+    if view_mode == "teacher":
+        title_y = height - 40          # 위쪽
+    else:
+        title_y = margin_y / 2         # 아래쪽
+
+    # 3) 좌석 영역 계산
+    available_h = height - margin_y * 2 - 80
+    cell_h = (available_h - gap_y * (rows - 1)) / rows if rows > 0 else 40
+
+    total_base_gaps = (cols - 1) * gap_x
+    total_pair_gaps = (bun_dan - 1) * pair_gap if seating_mode == "Paired" else 0
+
+    available_w = width - 80  # 좌우 여백 합
+    cell_w = (available_w - total_base_gaps - total_pair_gaps) / cols if cols > 0 else 40
+
+    total_width = cols * cell_w + total_base_gaps + total_pair_gaps
+    start_x = (width - total_width) / 2  # 가운데 정렬
+
+    # 4) 세로 시작점
+    if view_mode == "teacher":
+        start_y = height - margin_y - cell_h
+    else:
+        # 학생용: 책상을 조금 더 아래로 내려서 교탁과 간격 확보
+        start_y = height - margin_y - cell_h - 60
+
+    return {
+        "width": width,
+        "height": height,
+        "margin_y": margin_y,
+        "gap_x": gap_x,
+        "gap_y": gap_y,
+        "pair_gap": pair_gap,
+        "title_y": title_y,
+        "cell_w": cell_w,
+        "cell_h": cell_h,
+        "start_x": start_x,
+        "start_y": start_y,
+    }
+
+
+def cell_position(geo, r, c):
+    # 그리는 순서 기준 (r, c) 칸의 왼쪽 아래. 짝 모드는 두 칸마다 짝 간격이 더 들어간다.
+    x = geo["start_x"] + c * (geo["cell_w"] + geo["gap_x"]) + (c // 2) * geo["pair_gap"]
+    y = geo["start_y"] - r * (geo["cell_h"] + geo["gap_y"])
+    return x, y
+
+
+def podium_box(geo, view_mode):
+    # 교탁 상자 (x, y, 너비, 높이)
+    desk_w = 130
+    desk_h = 48
+    desk_x = geo["width"] / 2 - desk_w / 2
+
+    if view_mode == "teacher":
+        desk_y = geo["margin_y"] - desk_h       # 아래 중앙
+    else:
+        # 첫 줄 책상 위쪽 + 여백
+        desk_y = geo["start_y"] + geo["cell_h"] + 20
+    return desk_x, desk_y, desk_w, desk_h
+
+
+# =========================================================
+# 2. 형식과 상관없는 도형 목록
+# =========================================================
+# ("rect", x, y, w, h, 채우기 색, 테두리 색)
+# ("text", 가운데 x, 가운데 y, 글자 크기, 줄 목록, 글자 색)
+# 글자의 세로 위치는 가운데 기준이라 형식마다 기준선을 따로 맞춘다 (textfit.BASELINE).
+def _build_scene(matrix, seating_mode, view_mode, bun_dan, title):
+    font = load_korean_font().name
+    view = matrix.view(view_mode)  # 교사용: 앞줄이 아래
+    rows, cols = view.shape
+    geo = page_geometry(rows, cols, seating_mode, view_mode, bun_dan)
+    cell_w, cell_h = geo["cell_w"], geo["cell_h"]
+    fits = fit_table(view.table, cell_w, cell_h, font)
+    empty = fit_empty(cell_w, cell_h, font)
+    colors = view.table.colors
+
+    title_cy = geo["title_y"] + TITLE_SIZE * BASELINE  # PDF 는 제목 기준선이 title_y
+    scene = [("text", geo["width"] / 2, title_cy, TITLE_SIZE, (title,), TEXT_COLOR)]
+    for r, row in enumerate(view.grid.tolist()):
+        for c, idx in enumerate(row):
+            x, y = cell_position(geo, r, c)
+            if idx == EMPTY:
+                scene.append(("rect", x, y, cell_w, cell_h, EMPTY_FILL, EMPTY_STROKE))
+                fit = empty
+            else:
+                scene.append(("rect", x, y, cell_w, cell_h, colors[idx], colors[idx]))
+                fit = fits[idx]
+            scene.append(("text", x + cell_w / 2, y + cell_h / 2, fit.size, fit.lines, TEXT_COLOR))
+
+    x, y, w, h = podium_box(geo, view_mode)
+    scene.append(("rect", x, y, w, h, PODIUM_FILL, PODIUM_COLOR))
+    scene.append(("text", x + w / 2, y + h / 2, PODIUM_SIZE, ("교탁",), PODIUM_COLOR))
+    return scene
+
+
+def line_baselines(cy, size, lines):
+    # 가운데 y 가 cy 인 글자 줄들의 기준선 y (위 줄부터). textfit.text_ops 와 같은 계산.
+    leading = size * LEADING
+    top = cy + leading * (len(lines) - 1) / 2 - size * BASELINE
+    return [top - i * leading for i in range(len(lines))]
+
+
+def layout_scene(matrix, seating_mode, view_mode, bun_dan, title):
+    # 한 페이지의 도형 목록. SVG/PNG/인쇄용 HTML 이 같은 계산을 같이 쓴다.
+    key = content_key("scene", matrix, seating_mode, bun_dan, view_mode, title, load_korean_font().name)
+    return PAGE_CACHE.get_or_create(
+        key, lambda: _build_scene(matrix, seating_mode, view_mode, bun_dan, title)
+    )
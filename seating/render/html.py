@@ -0,0 +1,160 @@
+"""화면(Streamlit markdown)용 HTML 좌석표.
+
+좌석 칸 HTML 은 명단(SeatTable)마다 한 번만 만들어 두고, 배치마다 격자 인덱스로
+골라 이어 붙인다. 완성된 좌석표 조각은 배치 해시로 캐시한다.
+"""
+
+import html
+import re
+
+import numpy as np
+
+from seating.cache import CHART_CACHE, LRUCache, content_key
+from seating.engines import SEAT_COLORS, UNKNOWN_GENDER_COLOR
+from seating.metrics import register_cache, timed
+from seating.render.base import Renderer
+
+# =========================================================
+# 1. 스타일 (모듈을 불러올 때 한 번 만들어 둔다)
+# =========================================================
+# 자주 쓰는 좌석 색은 칸마다 style 을 붙이지 않도록 클래스로 만든다.
+COLOR_CLASSES = {
+    color: f"desk-c{i}"
+    for i, color in enumerate(dict.fromkeys([*SEAT_COLORS.values(), UNKNOWN_GENDER_COLOR]))
+}
+
+_STYLE_SOURCE = """
+    .desk-grid {
+        display: grid;
+        gap: 10px;
+        padding: 20px;
+        background-color: #f4f4f9;
+        border-radius: 12px;
+        width: fit-content;
+    }
+    .desk {
+        width: 120px;
+        height: 58px;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        border-radius: 8px;
+        font-weight: bold;
+        text-align: center;
+        font-size: 15px;
+        padding: 4px;
+        border: 2px solid #555;
+    }
+    .empty-desk {
+        background-color: #e0e7ff;
+        border-style: dashed;
+        color: #9ca3af;
+    }
+    .pair-gap {
+        width: 20px;
+    }
+    .front-of-class {
+        font-size: 1.6em;
+        font-weight: 900;
+        color: #2563eb;
+        border: 3px solid #2563eb;
+        padding: 8px 16px;
+        border-radius: 12px;
+        background-color: #eff6ff;
+        display: inline-block;
+    }
+""" + "".join(
+    f".{cls} {{ background-color: {color}; border-color: {color}; }}"
+    for color, cls in COLOR_CLASSES.items()
+)
+
+
+def _compile_style(css: str):
+    # 공백/줄바꿈을 줄여서 한 줄짜리 <style> 로
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};:,])\s*", r"\1", css)
+    return f"<style>{css.strip()}</style>"
+
+
+HTML_STYLE = _compile_style(_STYLE_SOURCE)
+
+FRONT_OF_CLASS_HTML = (
+    '<div style="text-align:center;"><span class="front-of-class">교탁</span></div>'
+)
+
+
+# =========================================================
+# 2. 좌석표 조각 템플릿
+# =========================================================
+_GRID_OPEN = '<div class="desk-grid" style="grid-template-columns: repeat({cols}, auto);">'
+_GRID_CLOSE = "</div>"
+_DESK = '<div class="desk {cls}">{name}</div>'
+_DESK_STYLED = '<div class="desk" style="background-color:{color};border-color:{color};">{name}</div>'
+_EMPTY_DESK = '<div class="desk empty-desk">빈 자리</div>'
+_PAIR_GAP = '<div class="pair-gap"></div>'
+
+# 명단별 좌석 칸 HTML: [빈 자리, 학생 0, 학생 1, ...] (격자 인덱스 + 1 로 바로 고른다)
+_CELL_CACHE = register_cache("chart_cells", LRUCache(max_entries=64))
+
+
+def _desk_html(name, color):
+    name = html.escape(name)
+    cls = COLOR_CLASSES.get(color)
+    if cls:
+        return _DESK.format(cls=cls, name=name)
+    return _DESK_STYLED.format(color=html.escape(color, quote=True), name=name)
+
+
+def _table_cells(table):
+    def build():
+        cells = [_EMPTY_DESK]
+        cells.extend(_desk_html(name, color) for name, color in zip(table.labels, table.colors))
+        return np.array(cells, dtype=object)
+
+    return _CELL_CACHE.get_or_create(table.digest(), build)
+
+
+def _build_chart(matrix, seating_mode):
+    cells = _table_cells(matrix.table)[matrix.grid + 1]  # EMPTY(-1) → 0 번 "빈 자리"
+    cols = matrix.cols
+    grid_cols = cols
+    if seating_mode == "Paired" and cols > 2:
+        # 짝 책상 사이 간격: 2, 4, ... 번째 열 앞에 빈 칸을 끼운다.
+        gaps = list(range(2, cols, 2))
+        cells = np.insert(cells, gaps, _PAIR_GAP, axis=1)
+        grid_cols += len(gaps)
+
+    parts = [_GRID_OPEN.format(cols=grid_cols)]
+    parts.extend(cells.ravel().tolist())
+    parts.append(_GRID_CLOSE)
+    return "".join(parts)
+
+
+@timed("render_chart")
+def render_chart(matrix, seating_mode="Single"):
+    # 같은 배치(명단 + 격자)면 다시 만들지 않는다. 다시 실행될 때마다 그대로 재사용.
+    key = content_key("chart", matrix, seating_mode)
+    return CHART_CACHE.get_or_create(key, lambda: _build_chart(matrix, seating_mode))
+
+
+# =========================================================
+# 3. 렌더러 인터페이스 구현 (HTML 파일로 저장할 때)
+# =========================================================
+class HtmlRenderer(Renderer):
+    name = "html"
+    mime = "text/html"
+    extension = "html"
+
+    def render(self, matrix, seating_mode, bun_dan, pages):
+        parts = ['<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8">', HTML_STYLE, "</head><body>"]
+        for view_mode, title in pages:
+            parts.append(f"<h2>{html.escape(title)}</h2>")
+            if view_mode == "teacher":
+                # 교사용: 앞줄이 아래, 교탁도 아래
+                parts.append(render_chart(matrix[::-1], seating_mode))
+                parts.append(FRONT_OF_CLASS_HTML)
+            else:
+                parts.append(FRONT_OF_CLASS_HTML)
+                parts.append(render_chart(matrix, seating_mode))
+        parts.append("</body></html>")
+        return "\n".join(parts)
@@ -0,0 +1,240 @@
+"""ReportLab PDF 백엔드 (A4 가로, 교사용/학생용 페이지). 칸 위치는 geometry 모듈이 계산한다."""
+
+import io
+
+from reportlab.lib.colors import HexColor, black
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.pdfgen import canvas
+
+from seating.cache import PAGE_CACHE, PDF_CACHE, content_key
+from seating.fonts import load_korean_font
+from seating.metrics import timed
+from seating.render.base import STUDENT_TITLE, TEACHER_TITLE, Renderer
+from seating.render.geometry import cell_position, page_geometry, podium_box
+from seating.render.textfit import fit_empty, fit_table, text_ops
+from seating.seatmatrix import EMPTY
+
+
+def font_name():
+    return load_korean_font().name
+
+
+# =========================================================
+# 1. 페이지 그리기 명령 계산
+# =========================================================
+# 좌석 한 칸 = 그리기 명령 CELL_OPS 개. 페이지 명령 목록은
+# [제목 TITLE_OPS 개] + [칸들 (그리는 순서대로)] + [교탁] 순서라서,
+# 칸 하나만 바뀌면 그 구간만 다시 계산해 바꿔 끼울 수 있다 (patch_pdf_page).
+TITLE_OPS = 2
+CELL_OPS = 6
+
+
+def _cell_ops(font, geo, x, y, color, fit):
+    # color 가 None 이면 빈 자리. fit: 이름 크기/줄바꿈 (textfit.LabelFit)
+    cell_w, cell_h = geo["cell_w"], geo["cell_h"]
+    if color:
+        ops = [
+            ("setFillColor", (HexColor(color),)),
+            ("setStrokeColor", (HexColor(color),)),
+        ]
+    else:
+        ops = [
+            ("setFillColor", (HexColor("#e0e7ff"),)),
+            ("setStrokeColor", (HexColor("#d1d5db"),)),
+        ]
+        fit = fit_empty(cell_w, cell_h, font)
+
+    ops.append(("rect", (x, y, cell_w, cell_h, 1, 1)))
+
+    ops.append(("setFillColor", (black,)))
+    ops.extend(text_ops(font, fit, x + cell_w / 2, y + cell_h / 2))
+    return ops
+
+
+@timed("pdf_layout")
+def layout_pdf_page(matrix, seating_mode, view_mode, bun_dan, title):
+    # 한 페이지를 canvas 메서드 호출 목록 [(메서드, 인자), ...] 으로 계산한다.
+    font = font_name()
+    ops = []
+
+    # 1) 행 순서 (교사용: 앞줄이 아래, 학생용: 앞줄이 위)
+    matrix_to_draw = matrix.view(view_mode)
+
+    rows, cols = matrix_to_draw.shape
+    geo = page_geometry(rows, cols, seating_mode, view_mode, bun_dan)
+    width = geo["width"]
+
+    ops.append(("setFont", (font, 26)))
+    ops.append(("drawCentredString", (width / 2, geo["title_y"], title)))
+
+    # 5) 좌석 그리기 (이름 크기는 명단 전체를 한 번에 맞춘 결과를 쓴다)
+    fits = fit_table(matrix.table, geo["cell_w"], geo["cell_h"], font)
+    colors = matrix.table.colors
+    for r, row in enumerate(matrix_to_draw.grid.tolist()):
+        for c_idx, idx in enumerate(row):
+            x, y = cell_position(geo, r, c_idx)
+            if idx == EMPTY:
+                ops.extend(_cell_ops(font, geo, x, y, None, None))
+            else:
+                ops.extend(_cell_ops(font, geo, x, y, colors[idx], fits[idx]))
+
+    # 6) 교탁 그리기
+    ops.extend(_podium_ops(font, geo, view_mode))
+    return ops
+
+
+def _podium_ops(font, geo, view_mode):
+    desk_x, desk_y, desk_w, desk_h = podium_box(geo, view_mode)
+    return [
+        ("setFillColor", (HexColor("#eff6ff"),)),
+        ("setStrokeColor", (HexColor("#2563eb"),)),
+        ("rect", (desk_x, desk_y, desk_w, desk_h, 1, 1)),
+        ("setFont", (font, 18)),
+        ("setFillColor", (HexColor("#2563eb"),)),
+        ("drawCentredString", (desk_x + desk_w / 2, desk_y + desk_h / 2 - 4, "교탁")),
+    ]
+
+
+def patch_pdf_page(ops, matrix, seating_mode, view_mode, bun_dan, seats):
+    # 이미 계산한 페이지 명령에서 seats [(행, 열), ...] (앞줄이 0행) 칸만 새 배치로 바꾼다.
+    font = font_name()
+    rows, cols = matrix.shape
+    geo = page_geometry(rows, cols, seating_mode, view_mode, bun_dan)
+    ops = list(ops)
+    fits = fit_table(matrix.table, geo["cell_w"], geo["cell_h"], font)
+    for r, c in seats:
+        draw_r = rows - 1 - r if view_mode == "teacher" else r
+        x, y = cell_position(geo, draw_r, c)
+        start = TITLE_OPS + CELL_OPS * (draw_r * cols + c)
+        idx = int(matrix.grid[r, c])
+        if idx == EMPTY:
+            cell = _cell_ops(font, geo, x, y, None, None)
+        else:
+            cell = _cell_ops(font, geo, x, y, matrix.table.colors[idx], fits[idx])
+        ops[start : start + CELL_OPS] = cell
+    return ops
+
+
+# =========================================================
+# 2. PDF 문서 만들기 (내용 해시 캐시)
+# =========================================================
+def page_ops(matrix, seating_mode, view_mode, bun_dan, title):
+    # 같은 배치의 교사용/학생용 페이지는 한 번만 계산하고, 단독 PDF와 합본 PDF가 함께 쓴다.
+    key = _page_key(matrix, seating_mode, view_mode, bun_dan, title)
+    return PAGE_CACHE.get_or_create(
+        key, lambda: layout_pdf_page(matrix, seating_mode, view_mode, bun_dan, title)
+    )
+
+
+def draw_pdf_page(c, matrix, seating_mode, view_mode, bun_dan, title):
+    run_ops(c, page_ops(matrix, seating_mode, view_mode, bun_dan, title))
+
+
+def _draw_centred_lines(c, x, y, leading, lines):
+    for i, line in enumerate(lines):
+        c.drawCentredString(x, y - i * leading, line)
+
+
+# canvas 에 없는 그리기 명령 (명령 목록에 한 항목으로 넣기 위한 것)
+_EXTRA_OPS = {"drawCentredLines": _draw_centred_lines}
+
+
+def run_ops(c, ops):
+    for method, args in ops:
+        extra = _EXTRA_OPS.get(method)
+        if extra is not None:
+            extra(c, *args)
+        else:
+            getattr(c, method)(*args)
+
+
+def _page_key(matrix, seating_mode, view_mode, bun_dan, title):
+    return content_key("page", matrix, seating_mode, bun_dan, view_mode, title, font_name())
+
+
+def reuse_pdf_pages(old_matrix, matrix, seating_mode, bun_dan, pages, seats):
+    # 명단이 조금 바뀐 배치: 이전 배치의 페이지 명령이 캐시에 있으면 바뀐 칸만 고쳐서
+    # 새 배치의 페이지로 미리 넣어 둔다. (없으면 나중에 평소처럼 전체를 계산한다)
+    for view_mode, title in pages:
+        ops = PAGE_CACHE.get(_page_key(old_matrix, seating_mode, view_mode, bun_dan, title))
+        if ops is not None and old_matrix.shape == matrix.shape:
+            PAGE_CACHE.put(
+                _page_key(matrix, seating_mode, view_mode, bun_dan, title),
+                patch_pdf_page(ops, matrix, seating_mode, view_mode, bun_dan, seats),
+            )
+
+
+def build_pdf(matrix, seating_mode, bun_dan, pages):
+    return build_pdf_document([(matrix, seating_mode, bun_dan, pages)])
+
+
+@timed("pdf_build")
+def build_pdf_document(sections):
+    # sections: [(matrix, seating_mode, bun_dan, pages), ...] 를 한 문서로 이어 그린다.
+    # 여러 반/여러 회차를 합칠 때도 폰트 서브셋은 문서당 한 번만 들어간다.
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=landscape(A4))
+    for matrix, seating_mode, bun_dan, pages in sections:
+        for view_mode, title in pages:
+            draw_pdf_page(c, matrix, seating_mode, view_mode, bun_dan, title)
+            c.showPage()
+    c.save()
+    buf.seek(0)
+    return buf.getvalue()
+
+
+@timed("pdf_build")
+def pdf_from_ops(pages_ops):
+    # 미리 계산한 페이지 명령 목록들로 PDF 를 만든다 (작업자 프로세스에서 부르는 용도).
+    # 명령 계산·부분 수정(PAGE_CACHE)은 서버 프로세스에 두고, 무거운 글꼴 서브셋과
+    # 압축만 작업자가 한다. 작업자 프로세스에도 폰트가 등록되어 있어야 한다.
+    load_korean_font()
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=landscape(A4))
+    for ops in pages_ops:
+        run_ops(c, ops)
+        c.showPage()
+    c.save()
+    return buf.getvalue()
+
+
+def pdf_pages_key(matrix, seating_mode, bun_dan, pages):
+    # 글꼴도 키에 넣는다: 디스크 보관함의 PDF 는 서버 글꼴이 바뀐 뒤에도 남아 있다.
+    return content_key("pdf", matrix, seating_mode, bun_dan, [tuple(p) for p in pages], font_name())
+
+
+@timed("make_pdf")
+def make_pdf_pages(matrix, seating_mode, bun_dan, pages):
+    # 배치가 바뀌지 않았으면 ReportLab 을 거치지 않고 캐시된 PDF 를 돌려준다.
+    pages = [tuple(p) for p in pages]
+    key = pdf_pages_key(matrix, seating_mode, bun_dan, pages)
+    return PDF_CACHE.get_or_create(
+        key, lambda: build_pdf(matrix, seating_mode, bun_dan, pages)
+    )
+
+
+def make_pdf(matrix, seating_mode, view_mode, bun_dan, title):
+    return make_pdf_pages(matrix, seating_mode, bun_dan, [(view_mode, title)])
+
+
+def make_pdf_both(
+    matrix,
+    seating_mode,
+    bun_dan,
+    teacher_title=TEACHER_TITLE,
+    student_title=STUDENT_TITLE,
+):
+    pages = [("teacher", teacher_title), ("student", student_title)]
+    return make_pdf_pages(matrix, seating_mode, bun_dan, pages)
+
+
+# =========================================================
+# 3. 렌더러 인터페이스 구현
+# =========================================================
+class PdfRenderer(Renderer):
+    name = "pdf"
+    mime = "application/pdf"
+    extension = "pdf"
+
+    def render(self, matrix, seating_mode, bun_dan, pages):
+        return make_pdf_pages(matrix, seating_mode, bun_dan, pages)
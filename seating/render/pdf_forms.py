@@ -0,0 +1,157 @@
+"""Form XObject 를 쓰는 PDF 백엔드 (여러 반/여러 회차 합본용).
+
+페이지마다 달라지지 않는 배경 — 모든 칸의 빈 자리 상자와 "빈 자리" 글자, 교탁 —
+은 격자 모양(줄, 칸, 좌석 형태, 보기, 분단)마다 문서에 한 번만 Form XObject 로 넣고
+(beginForm / doForm), 페이지에는 제목과 학생이 앉은 칸만 덧그린다.
+덧그릴 때는 색이 같은 칸을 묶어서 색 바꾸기·글꼴 지정을 색마다 한 번만 한다.
+
+그리기 명령 목록은 캐시해 두므로 배경·덧그림 계산은 문서가 달라도 다시 하지 않는다.
+(Form XObject 자체는 PDF 문서 안의 객체라서 문서마다 한 번씩은 써야 한다)
+"""
+
+import hashlib
+import io
+
+from reportlab.lib.colors import HexColor, black
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.pdfgen import canvas
+
+from seating.cache import PAGE_CACHE, PDF_CACHE, content_key
+from seating.metrics import timed
+from seating.render.base import Renderer
+from seating.render.geometry import cell_position, page_geometry
+from seating.render.pdf import _cell_ops, _podium_ops, font_name, run_ops
+from seating.render.textfit import fit_table, text_ops
+from seating.seatmatrix import EMPTY
+
+
+# =========================================================
+# 1. 배경 (격자 모양마다 한 번)
+# =========================================================
+def _geometry_key(rows, cols, seating_mode, view_mode, bun_dan):
+    return (rows, cols, seating_mode, view_mode, bun_dan, font_name())
+
+
+def form_name(geometry_key):
+    digest = hashlib.sha1(repr(geometry_key).encode("utf-8")).hexdigest()[:12]
+    return f"SeatBg{digest}"
+
+
+def layout_background(rows, cols, seating_mode, view_mode, bun_dan):
+    font = font_name()
+    geo = page_geometry(rows, cols, seating_mode, view_mode, bun_dan)
+    ops = []
+    for r in range(rows):
+        for c in range(cols):
+            x, y = cell_position(geo, r, c)
+            ops.extend(_cell_ops(font, geo, x, y, None, None))
+    ops.extend(_podium_ops(font, geo, view_mode))
+    return ops
+
+
+# =========================================================
+# 2. 페이지마다 덧그리기 (제목 + 학생 칸, 색별/글자 크기별로 묶음)
+# =========================================================
+def layout_overlay(matrix, seating_mode, view_mode, bun_dan, title):
+    font = font_name()
+    view = matrix.view(view_mode)  # 교사용: 앞줄이 아래
+    rows, cols = view.shape
+    geo = page_geometry(rows, cols, seating_mode, view_mode, bun_dan)
+    cell_w, cell_h = geo["cell_w"], geo["cell_h"]
+    colors = view.table.colors
+    fits = fit_table(view.table, cell_w, cell_h, font)
+
+    ops = [
+        ("setFont", (font, 26)),
+        ("setFillColor", (black,)),
+        ("drawCentredString", (geo["width"] / 2, geo["title_y"], title)),
+    ]
+
+    # 색별 칸 목록, 글자 크기별 이름 목록 (처음 나온 순서대로)
+    by_color = {}
+    by_size = {}
+    grid = view.grid.tolist()
+    for r in range(rows):
+        for c in range(cols):
+            idx = grid[r][c]
+            if idx == EMPTY:
+                continue
+            x, y = cell_position(geo, r, c)
+            by_color.setdefault(colors[idx], []).append((x, y))
+            fit = fits[idx]
+            by_size.setdefault(fit.size, []).append((x + cell_w / 2, y + cell_h / 2, fit))
+
+    for color, cells in by_color.items():
+        fill = HexColor(color)
+        ops.append(("setFillColor", (fill,)))
+        ops.append(("setStrokeColor", (fill,)))
+        for x, y in cells:
+            ops.append(("rect", (x, y, cell_w, cell_h, 1, 1)))
+
+    if by_size:
+        ops.append(("setFillColor", (black,)))
+    for size, names in by_size.items():
+        ops.append(("setFont", (font, size)))
+        for cx, cy, fit in names:
+            ops.append(text_ops(font, fit, cx, cy)[1])  # 글꼴은 크기마다 한 번만
+    return ops
+
+
+# =========================================================
+# 3. 문서 만들기
+# =========================================================
+def draw_form_page(c, forms: set, matrix, seating_mode, view_mode, bun_dan, title):
+    # forms: 이 문서에 이미 넣은 배경 이름들
+    rows, cols = matrix.shape
+    geometry = _geometry_key(rows, cols, seating_mode, view_mode, bun_dan)
+    name = form_name(geometry)
+    if name not in forms:
+        background = PAGE_CACHE.get_or_create(
+            ("background", geometry),
+            lambda: layout_background(rows, cols, seating_mode, view_mode, bun_dan),
+        )
+        c.beginForm(name)
+        run_ops(c, background)
+        c.endForm()
+        forms.add(name)
+
+    c.saveState()
+    c.doForm(name)
+    c.restoreState()
+
+    key = content_key("overlay", matrix, seating_mode, bun_dan, view_mode, title, font_name())
+    overlay = PAGE_CACHE.get_or_create(
+        key, lambda: layout_overlay(matrix, seating_mode, view_mode, bun_dan, title)
+    )
+    run_ops(c, overlay)
+
+
+@timed("pdf_form_build")
+def build_form_pdf_document(sections):
+    # sections: [(matrix, seating_mode, bun_dan, pages), ...] — build_pdf_document 와 같은 모양
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=landscape(A4))
+    forms = set()
+    for matrix, seating_mode, bun_dan, pages in sections:
+        for view_mode, title in pages:
+            draw_form_page(c, forms, matrix, seating_mode, view_mode, bun_dan, title)
+            c.showPage()
+    c.save()
+    return buf.getvalue()
+
+
+def make_form_pdf_pages(matrix, seating_mode, bun_dan, pages):
+    pages = [tuple(p) for p in pages]
+    key = content_key("pdf-form", matrix, seating_mode, bun_dan, pages, font_name())
+    return PDF_CACHE.get_or_create(
+        key, lambda: build_form_pdf_document([(matrix, seating_mode, bun_dan, pages)])
+    )
+
+
+class FormPdfRenderer(Renderer):
+    name = "pdf-form"
+    mime = "application/pdf"
+    extension = "form.pdf"
+
+    def render(self, matrix, seating_mode, bun_dan, pages):
+        return make_form_pdf_pages(matrix, seating_mode, bun_dan, pages)
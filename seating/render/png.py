@@ -0,0 +1,76 @@
+"""PNG 백엔드 (서버에서 Pillow 로 바로 그린다, 프로젝터용 1920px 너비).
+
+여러 페이지면 한 이미지에 위에서 아래로 이어 붙인다.
+"""
+
+import io
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFont
+
+from seating.cache import EXPORT_CACHE, content_key
+from seating.fonts import load_korean_font
+from seating.metrics import register_cache, timed
+from seating.render.base import Renderer
+from seating.render.geometry import PAGE_HEIGHT, PAGE_WIDTH, layout_scene, line_baselines
+
+PNG_WIDTH = 1920
+
+
+@lru_cache(maxsize=64)
+def _image_font(px: int):
+    path = load_korean_font().path
+    if path is None:
+        return ImageFont.load_default(px)  # 한글 폰트가 없으면 기본 글꼴
+    return ImageFont.truetype(path, px)
+
+
+register_cache("png_font", _image_font)
+
+
+def draw_scene(draw, scene, scale, top=0):
+    # 도형 목록을 scale 배(pt → px)로 그린다. top: 이 페이지의 위쪽 y (px)
+    bottom = top + PAGE_HEIGHT * scale
+    for shape in scene:
+        if shape[0] == "rect":
+            _, x, y, w, h, fill, stroke = shape
+            box = [x * scale, bottom - (y + h) * scale, (x + w) * scale, bottom - y * scale]
+            draw.rectangle(box, fill=fill, outline=stroke, width=max(1, round(scale)))
+        else:
+            _, cx, cy, size, lines, color = shape
+            font = _image_font(max(1, round(size * scale)))
+            for line, base in zip(lines, line_baselines(cy, size, lines)):
+                draw.text((cx * scale, bottom - base * scale), line, fill=color, font=font, anchor="ms")
+
+
+@timed("png_build")
+def build_png(scenes, width=PNG_WIDTH):
+    scale = width / PAGE_WIDTH
+    page_h = round(PAGE_HEIGHT * scale)
+    image = Image.new("RGB", (width, page_h * len(scenes)), "#ffffff")
+    draw = ImageDraw.Draw(image)
+    for i, scene in enumerate(scenes):
+        draw_scene(draw, scene, scale, i * page_h)
+    buf = io.BytesIO()
+    image.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def make_png_pages(matrix, seating_mode, bun_dan, pages, width=PNG_WIDTH):
+    pages = [tuple(p) for p in pages]
+    key = content_key("png", matrix, seating_mode, bun_dan, pages, width, load_korean_font().name)
+    return EXPORT_CACHE.get_or_create(
+        key,
+        lambda: build_png(
+            [layout_scene(matrix, seating_mode, v, bun_dan, t) for v, t in pages], width
+        ),
+    )
+
+
+class PngRenderer(Renderer):
+    name = "png"
+    mime = "image/png"
+    extension = "png"
+
+    def render(self, matrix, seating_mode, bun_dan, pages):
+        return make_png_pages(matrix, seating_mode, bun_dan, pages)
@@ -0,0 +1,79 @@
+"""인쇄용 HTML 백엔드: PDF 와 같은 위치(pt)에 상자를 놓고 @page 로 A4 가로 한 장씩 찍는다.
+
+브라우저에서 바로 열어 인쇄(또는 PDF 로 저장)하면 되므로 서버에서 폰트를 넣을 필요가 없다.
+"""
+
+import html
+
+from seating.cache import EXPORT_CACHE, content_key
+from seating.fonts import load_korean_font
+from seating.metrics import timed
+from seating.render.base import Renderer
+from seating.render.geometry import PAGE_HEIGHT, PAGE_WIDTH, layout_scene
+from seating.render.textfit import LEADING
+
+PRINT_STYLE = (
+    "<style>"
+    "@page{size:A4 landscape;margin:0}"
+    "body{margin:0;font-family:MaruBuri,'Noto Sans KR','Malgun Gothic',sans-serif;"
+    "-webkit-print-color-adjust:exact;print-color-adjust:exact}"
+    f".sheet{{position:relative;width:{PAGE_WIDTH:.2f}pt;height:{PAGE_HEIGHT:.2f}pt;"
+    "overflow:hidden;background:#fff;break-after:page}"
+    ".sheet:last-child{break-after:auto}"
+    ".box{position:absolute;box-sizing:border-box;border:1pt solid}"
+    f".txt{{position:absolute;transform:translate(-50%,-50%);white-space:nowrap;"
+    f"text-align:center;line-height:{LEADING}}}"
+    "@media screen{body{background:#9ca3af}.sheet{margin:12pt auto;box-shadow:0 0 6pt #0004}}"
+    "</style>"
+)
+
+_BOX = '<div class="box" style="left:{x:.2f}pt;top:{y:.2f}pt;width:{w:.2f}pt;height:{h:.2f}pt;background:{fill};border-color:{stroke}"></div>'
+_TXT = '<div class="txt" style="left:{x:.2f}pt;top:{y:.2f}pt;font-size:{size}pt;color:{color}">{text}</div>'
+
+
+def scene_html(scene):
+    parts = ['<div class="sheet">']
+    for shape in scene:
+        if shape[0] == "rect":
+            _, x, y, w, h, fill, stroke = shape
+            parts.append(_BOX.format(x=x, y=PAGE_HEIGHT - y - h, w=w, h=h, fill=fill, stroke=stroke))
+        else:
+            _, cx, cy, size, lines, color = shape
+            text = "<br>".join(html.escape(line) for line in lines)
+            parts.append(_TXT.format(x=cx, y=PAGE_HEIGHT - cy, size=size, color=color, text=text))
+    parts.append("</div>")
+    return "".join(parts)
+
+
+@timed("print_html_build")
+def build_print_html(scenes, title=""):
+    parts = [
+        '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8">',
+        f"<title>{html.escape(title)}</title>",
+        PRINT_STYLE,
+        "</head><body>",
+    ]
+    parts.extend(scene_html(scene) for scene in scenes)
+    parts.append("</body></html>")
+    return "\n".join(parts)
+
+
+def make_print_html_pages(matrix, seating_mode, bun_dan, pages):
+    pages = [tuple(p) for p in pages]
+    key = content_key("print-html", matrix, seating_mode, bun_dan, pages, load_korean_font().name)
+    title = pages[0][1] if pages else ""
+    return EXPORT_CACHE.get_or_create(
+        key,
+        lambda: build_print_html(
+            [layout_scene(matrix, seating_mode, v, bun_dan, t) for v, t in pages], title
+        ),
+    )
+
+
+class PrintHtmlRenderer(Renderer):
+    name = "print-html"
+    mime = "text/html"
+    extension = "print.html"
+
+    def render(self, matrix, seating_mode, bun_dan, pages):
+        return make_print_html_pages(matrix, seating_mode, bun_dan, pages)
@@ -0,0 +1,65 @@
+"""SVG 백엔드 (프로젝터 화면용). 폰트를 넣지 않으므로 PDF 보다 훨씬 가볍고 빠르다.
+
+여러 페이지면 한 SVG 안에 위에서 아래로 이어 붙인다.
+"""
+
+from xml.sax.saxutils import escape, quoteattr
+
+from seating.cache import EXPORT_CACHE, content_key
+from seating.fonts import load_korean_font
+from seating.metrics import timed
+from seating.render.base import Renderer
+from seating.render.geometry import PAGE_HEIGHT, PAGE_WIDTH, layout_scene, line_baselines
+
+FONT_FAMILY = "MaruBuri, 'Noto Sans KR', 'Malgun Gothic', sans-serif"
+
+_RECT = '<rect x="{x:.2f}" y="{y:.2f}" width="{w:.2f}" height="{h:.2f}" fill="{fill}" stroke="{stroke}"/>'
+_TEXT = '<text x="{x:.2f}" y="{y:.2f}" font-size="{size}" fill="{color}">{text}</text>'
+
+
+def scene_svg(scene, top=0.0):
+    # 도형 목록 → SVG 요소 (top: 이 페이지의 위쪽 y, y 축은 아래로 뒤집는다)
+    bottom = top + PAGE_HEIGHT
+    parts = []
+    for shape in scene:
+        if shape[0] == "rect":
+            _, x, y, w, h, fill, stroke = shape
+            parts.append(_RECT.format(x=x, y=bottom - y - h, w=w, h=h, fill=fill, stroke=stroke))
+        else:
+            _, cx, cy, size, lines, color = shape
+            for line, base in zip(lines, line_baselines(cy, size, lines)):
+                parts.append(_TEXT.format(x=cx, y=bottom - base, size=size, color=color, text=escape(line)))
+    return parts
+
+
+@timed("svg_build")
+def build_svg(scenes):
+    height = PAGE_HEIGHT * len(scenes)
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {PAGE_WIDTH:.2f} {height:.2f}" '
+        f'width="{PAGE_WIDTH:.2f}pt" height="{height:.2f}pt" font-family={quoteattr(FONT_FAMILY)} '
+        'text-anchor="middle">',
+        '<rect width="100%" height="100%" fill="#ffffff"/>',
+    ]
+    for i, scene in enumerate(scenes):
+        parts.extend(scene_svg(scene, i * PAGE_HEIGHT))
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+def make_svg_pages(matrix, seating_mode, bun_dan, pages):
+    pages = [tuple(p) for p in pages]
+    key = content_key("svg", matrix, seating_mode, bun_dan, pages, load_korean_font().name)
+    return EXPORT_CACHE.get_or_create(
+        key,
+        lambda: build_svg([layout_scene(matrix, seating_mode, v, bun_dan, t) for v, t in pages]),
+    )
+
+
+class SvgRenderer(Renderer):
+    name = "svg"
+    mime = "image/svg+xml"
+    extension = "svg"
+
+    def render(self, matrix, seating_mode, bun_dan, pages):
+        return make_svg_pages(matrix, seating_mode, bun_dan, pages)
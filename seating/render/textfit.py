@@ -0,0 +1,177 @@
+"""PDF 좌석 칸에 이름 맞추기: 글자 폭 캐시 + 명단 전체를 한 번에 글자 크기/줄바꿈 계산.
+
+분단이 많아 칸이 좁으면 16pt 로는 이름이 칸 밖으로 나간다. 이름마다 stringWidth 를
+크기별로 여러 번 부르는 대신,
+- 폰트의 글자 폭(1/1000 em)을 글자마다 한 번만 찾아 캐시하고,
+- 명단의 모든 이름을 한 줄로 이어 붙여 글자 폭 누적합 한 번으로 이름 폭을 구한 뒤,
+- 한 줄 크기 / 두 줄(번호 | 이름) 크기를 배열 연산으로 정한다.
+결과는 (명단, 칸 크기, 폰트) 별로 캐시되어 교사용/학생용 페이지가 같이 쓴다.
+"""
+
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+from seating.cache import FIT_CACHE, content_key
+from seating.fonts import load_korean_font
+from seating.metrics import register_cache
+
+MAX_SIZE = 16.0  # 기본 이름 크기 (예전 고정값)
+MIN_SIZE = 7.0
+TINY_SIZE = 5.0  # MIN_SIZE 로도 넘치는 이름만 여기까지 더 줄인다 (그래도 넘치면 줄임표)
+WRAP_BELOW = 12.0  # 한 줄로 맞추면 이보다 작아질 때 두 줄을 고려한다
+PADDING = 4.0  # 칸 좌우 여백 (pt)
+PADDING_RATIO = 0.1  # 좁은 칸에서는 여백을 칸 폭의 10% 까지만
+LEADING = 1.15  # 두 줄일 때 줄 간격 (글자 크기 배수)
+BASELINE = 0.3125  # 칸 가운데에서 기준선까지 (글자 크기 배수, 16pt → 5pt)
+ELLIPSIS = "…"  # MIN_SIZE 로도 칸을 넘는 줄의 끝에 붙인다
+
+
+@dataclass(frozen=True)
+class LabelFit:
+    size: float
+    lines: tuple  # 한 줄이면 (이름,), 두 줄이면 (번호, 이름)
+
+
+# =========================================================
+# 1. 글자 폭 캐시
+# =========================================================
+class GlyphWidths:
+    def __init__(self, font_name: str, ttfont=None):
+        self.font_name = font_name
+        self._face = ttfont.face if ttfont is not None else None
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def _width(self, code: int):
+        w = self._cache.get(code)
+        if w is None:
+            if self._face is not None:
+                w = self._face.charWidths.get(code, self._face.defaultWidth)
+            else:
+                w = stringWidth(chr(code), self.font_name, 1000)
+            with self._lock:
+                self._cache[code] = w
+        return w
+
+    def lookup(self, codes: np.ndarray):
+        # 코드포인트 배열 → 글자 폭 배열 (서로 다른 글자만 한 번씩 찾는다)
+        uniq, inverse = np.unique(codes, return_inverse=True)
+        widths = np.fromiter((self._width(int(c)) for c in uniq), dtype=np.float64, count=len(uniq))
+        return widths[inverse]
+
+
+@lru_cache(maxsize=None)
+def glyph_widths(font_name: str):
+    font = load_korean_font()
+    ttfont = font.ttfont if font.name == font_name else None
+    return GlyphWidths(font_name, ttfont)
+
+
+# =========================================================
+# 2. 명단 전체 한 번에 재기 / 맞추기
+# =========================================================
+def measure_labels(labels, font_name: str):
+    # (전체 폭, 앞부분 폭, 뒷부분 폭, 나누는 위치, 건너뛸 글자 수) — 폭은 1pt 글자 기준
+    labels = list(labels)
+    n = len(labels)
+    lengths = np.fromiter((len(s) for s in labels), dtype=np.int64, count=n)
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+
+    codes = np.frombuffer("".join(labels).encode("utf-32-le"), dtype="<u4")
+    cum = np.concatenate([[0.0], np.cumsum(glyph_widths(font_name).lookup(codes))]) / 1000.0
+    total = cum[ends] - cum[starts]
+
+    # 두 줄로 나눌 때: 첫 공백(번호 | 이름) 에서, 공백이 없으면 가운데에서
+    spaces = np.fromiter((s.find(" ") for s in labels), dtype=np.int64, count=n)
+    has_space = spaces >= 0
+    split = np.where(has_space, spaces, lengths // 2)
+    skip = has_space.astype(np.int64)
+    head = cum[starts + split] - cum[starts]
+    tail = cum[ends] - cum[starts + split + skip]
+    return total, head, tail, split, skip
+
+
+def fit_labels(labels, cell_w: float, cell_h: float, font_name: str):
+    labels = list(labels)
+    if not labels:
+        return []
+    total, head, tail, split, skip = measure_labels(labels, font_name)
+    avail = max(cell_w - 2 * min(PADDING, cell_w * PADDING_RATIO), 1.0)
+
+    with np.errstate(divide="ignore"):
+        one = np.minimum(MAX_SIZE, avail / total)
+        one = np.minimum(one, cell_h * 0.8)
+        two = np.minimum(MAX_SIZE, avail / np.maximum(head, tail))
+        two = np.minimum(two, cell_h / (2 * LEADING + 0.2))
+
+    wrap = (one < WRAP_BELOW) & (two > one) & (head > 0) & (tail > 0)
+    size = np.maximum(np.where(wrap, two, one), MIN_SIZE)
+
+    # 분단이 아주 많아 MIN_SIZE 로도 칸을 넘는 이름은 TINY_SIZE 까지 더 줄이고,
+    # 그래도 넘치면 칸 밖으로 나가지 않게 줄임표로 자른다.
+    widest = np.where(wrap, np.maximum(head, tail), total)
+    with np.errstate(divide="ignore"):
+        size = np.where(widest * size > avail, np.maximum(avail / widest, TINY_SIZE), size)
+    size = np.floor(size * 100) / 100  # 반올림으로 칸 폭을 넘지 않게 내림
+    overflow = widest * size > avail + 1e-6
+
+    fits = []
+    for label, s, w, k, j, o in zip(
+        labels, size.tolist(), wrap.tolist(), split.tolist(), skip.tolist(), overflow.tolist()
+    ):
+        lines = (label[:k], label[k + j :]) if w else (label,)
+        if o:
+            lines = tuple(_ellipsize(line, s, avail, font_name) for line in lines)
+        fits.append(LabelFit(s, lines))
+    return fits
+
+
+def _ellipsize(text: str, size: float, avail: float, font_name: str):
+    # size 로 그렸을 때 avail 안에 들어가는 만큼만 남기고 "…" 을 붙인다 (들어가면 그대로).
+    codes = np.frombuffer((text + ELLIPSIS).encode("utf-32-le"), dtype="<u4")
+    widths = glyph_widths(font_name).lookup(codes) * (size / 1000.0)
+    cum = np.cumsum(widths[:-1])
+    if not len(cum) or cum[-1] <= avail + 1e-6:
+        return text
+    keep = int(np.searchsorted(cum, avail - widths[-1], side="right"))
+    return text[:keep].rstrip() + ELLIPSIS
+
+
+def fit_table(table, cell_w: float, cell_h: float, font_name: str):
+    # SeatTable 의 학생 순서 그대로 LabelFit 목록. 같은 명단·칸 크기면 다시 계산하지 않는다.
+    key = content_key("fit", table, round(cell_w, 2), round(cell_h, 2), font_name)
+    return FIT_CACHE.get_or_create(key, lambda: fit_labels(table.labels, cell_w, cell_h, font_name))
+
+
+EMPTY_LABEL = "빈 자리"
+EMPTY_MAX_SIZE = 14.0
+
+
+@lru_cache(maxsize=256)
+def fit_empty(cell_w: float, cell_h: float, font_name: str):
+    fit = fit_labels([EMPTY_LABEL], cell_w, cell_h, font_name)[0]
+    return LabelFit(min(fit.size, EMPTY_MAX_SIZE), fit.lines)
+
+
+register_cache("fit_empty", fit_empty)
+
+
+def text_ops(font_name: str, fit: LabelFit, cx: float, cy: float):
+    # 칸 가운데 (cx, cy) 에 이름을 그리는 명령 2개 (글꼴 지정 + 그리기)
+    size = fit.size
+    if len(fit.lines) == 1:
+        return [
+            ("setFont", (font_name, size)),
+            ("drawCentredString", (cx, cy - size * BASELINE, fit.lines[0])),
+        ]
+    leading = size * LEADING
+    top = cy + leading / 2 - size * BASELINE
+    return [
+        ("setFont", (font_name, size)),
+        ("drawCentredLines", (cx, top, leading, fit.lines)),
+    ]
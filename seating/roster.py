@@ -0,0 +1,285 @@
+"""업로드된 학생 명단(엑셀 / CSV·TSV / 붙여넣기)을 한 번만 읽고 정규화해서 세션에 보관한다."""
+
+import csv
+import hashlib
+import io
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+from seating.cache import TieredCache, content_key
+from seating.metrics import register_cache, timed
+
+REQUIRED_COLS = ["출석 번호", "이름", "성별"]
+
+# 성별 표기 → 표준값 ("남" / "여")
+GENDER_ALIASES = {
+    "M": "남", "m": "남", "남": "남", "남자": "남", "male": "남", "MALE": "남",
+    "F": "여", "f": "여", "여": "여", "여자": "여", "female": "여", "FEMALE": "여",
+}
+
+
+class RosterError(ValueError):
+    pass
+
+
+# =========================================================
+# 1. 정규화
+# =========================================================
+def clean_text(col: pd.Series):
+    return col.where(col.notna(), "").astype(str).str.strip()
+
+
+def _clean_number(col: pd.Series):
+    # 엑셀에서 3 이 3.0 으로 읽히는 경우가 있어 정수면 정수 문자열로 맞춘다.
+    num = pd.to_numeric(col, errors="coerce")
+    is_int = num.notna() & (num % 1 == 0)
+    out = clean_text(col)
+    out[is_int] = num[is_int].astype("int64").astype(str)
+    return out
+
+
+def normalize_roster(df: pd.DataFrame):
+    missing = [c for c in REQUIRED_COLS if c not in df.columns]
+    if missing:
+        raise RosterError(f"엑셀에 {REQUIRED_COLS} 컬럼이 모두 있어야 합니다.")
+
+    df = df[REQUIRED_COLS].dropna(how="all")
+
+    gender = clean_text(df["성별"])
+    roster = pd.DataFrame(
+        {
+            "출석 번호": _clean_number(df["출석 번호"]),
+            "이름": clean_text(df["이름"]),
+            "성별": gender.map(GENDER_ALIASES).fillna(gender),
+        }
+    )
+    return roster.reset_index(drop=True)
+
+
+# =========================================================
+# 2. 파일 읽기 (내용 해시 기준 1회)
+# =========================================================
+def file_digest(data: bytes):
+    return hashlib.sha1(data).hexdigest()
+
+
+def _is_xlsx(data: bytes):
+    return data[:4] == b"PK\x03\x04"  # xlsx 는 zip 파일
+
+
+def _stream_sheet(ws):
+    # 읽기 전용 시트에서 머리글 줄만 먼저 읽어 필요한 열이 없으면 바로 실패하고,
+    # 있으면 세 열만 한 줄씩 읽어 온다. (나이스 내보내기처럼 열이 많은 파일용)
+    header = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
+    names = list(header)
+    missing = [c for c in REQUIRED_COLS if c not in names]
+    if missing:
+        raise RosterError(f"엑셀에 {REQUIRED_COLS} 컬럼이 모두 있어야 합니다.")
+
+    # 세 열을 덮는 범위만 읽는다 (그 밖의 열은 셀 값으로 바꾸지 않는다).
+    columns = [names.index(c) for c in REQUIRED_COLS]
+    lo, hi = min(columns), max(columns)
+    picks = [c - lo for c in columns]
+    rows = []
+    for row in ws.iter_rows(min_row=2, min_col=lo + 1, max_col=hi + 1, values_only=True):
+        values = tuple(row[i] if i < len(row) else None for i in picks)
+        if any(v is not None for v in values):
+            rows.append(values)
+    return pd.DataFrame(rows or None, columns=REQUIRED_COLS, dtype=object)
+
+
+def read_roster(data: bytes):
+    # 첫 번째 시트의 명단. xlsx 가 아니면 (예: 옛 .xls) 예전처럼 pandas 로 통째로 읽는다.
+    if not _is_xlsx(data):
+        with timed("read_excel"):
+            raw = pd.read_excel(io.BytesIO(data))
+        with timed("normalize_roster"):
+            return normalize_roster(raw)
+
+    with timed("read_excel"):
+        wb = load_workbook(io.BytesIO(data), read_only=True, data_only=True)
+        try:
+            raw = _stream_sheet(wb.worksheets[0])
+        finally:
+            wb.close()
+    with timed("normalize_roster"):
+        return normalize_roster(raw)
+
+
+def read_roster_sheets(data: bytes, file_name: str = ""):
+    # 모든 시트의 명단: [(시트 이름, DataFrame 또는 RosterError), ...]
+    # 파일 자체를 못 읽으면 예외를 그대로 올린다. CSV/TSV 는 시트 하나로 본다.
+    if not _is_xlsx(data) and file_name.lower().endswith(TEXT_SUFFIXES):
+        try:
+            return [("", read_roster_text(decode_text(data)))]
+        except RosterError as e:
+            return [("", e)]
+
+    sheets = []
+    if not _is_xlsx(data):
+        with timed("read_excel"):
+            raw_sheets = pd.read_excel(io.BytesIO(data), sheet_name=None)
+        for name, raw in raw_sheets.items():
+            try:
+                sheets.append((name, normalize_roster(raw)))
+            except RosterError as e:
+                sheets.append((name, e))
+        return sheets
+
+    with timed("read_excel"):
+        wb = load_workbook(io.BytesIO(data), read_only=True, data_only=True)
+        try:
+            for ws in wb.worksheets:
+                try:
+                    sheets.append((ws.title, normalize_roster(_stream_sheet(ws))))
+                except RosterError as e:
+                    sheets.append((ws.title, e))
+        finally:
+            wb.close()
+    return sheets
+
+
+# =========================================================
+# 3. CSV / TSV / 스프레드시트에서 붙여넣은 글
+# =========================================================
+TEXT_SUFFIXES = (".csv", ".tsv", ".txt")
+
+
+def decode_text(data: bytes):
+    # 엑셀에서 "CSV 로 저장"한 한글 파일은 대개 cp949 라서 utf-8 이 안 되면 cp949 로 읽는다.
+    try:
+        return data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        try:
+            return data.decode("cp949")
+        except UnicodeDecodeError:
+            raise RosterError("글자 인코딩을 알 수 없습니다. UTF-8 이나 CP949(엑셀 기본)로 저장해 주세요.") from None
+
+
+def read_roster_text(text: str):
+    # 구분자는 첫 줄로 정한다: 탭이 있으면 탭(스프레드시트 붙여넣기 / TSV), 없으면 쉼표.
+    # 머리글이 없고 칸이 딱 세 개이며 첫 칸이 번호면 "출석 번호, 이름, 성별" 순서로 본다.
+    lines = [line for line in text.splitlines() if line.strip()]
+    if not lines:
+        raise RosterError("명단이 비어 있습니다.")
+    sep = "\t" if "\t" in lines[0] else ","
+    header = [name.strip() for name in next(csv.reader([lines[0]], delimiter=sep))]
+
+    if all(c in header for c in REQUIRED_COLS):
+        names, body = header, lines[1:]
+    elif len(header) == len(REQUIRED_COLS) and header[0].replace(".", "", 1).isdigit():
+        names, body = REQUIRED_COLS, lines
+    else:
+        raise RosterError(f"첫 줄에 {REQUIRED_COLS} 머리글이 모두 있어야 합니다.")
+
+    with timed("read_text"):
+        raw = pd.read_csv(
+            io.StringIO("\n".join(body)),
+            sep=sep,
+            header=None,
+            names=names,
+            usecols=REQUIRED_COLS,
+            dtype=str,
+            keep_default_na=False,
+            na_values=[""],
+        )
+    with timed("normalize_roster"):
+        return normalize_roster(raw)
+
+
+def read_roster_file(data: bytes, file_name: str = ""):
+    # 파일 이름(확장자)으로 CSV/TSV 를 가르고, 나머지는 엑셀로 읽는다.
+    if not _is_xlsx(data) and file_name.lower().endswith(TEXT_SUFFIXES):
+        return read_roster_text(decode_text(data))
+    return read_roster(data)
+
+
+# =========================================================
+# 4. 세션 보관
+# =========================================================
+def roster_digest(df: pd.DataFrame):
+    # 정규화된 명단 내용의 해시 (파일 형식/시트 위치와 상관없이 같은 명단이면 같다)
+    hashed = pd.util.hash_pandas_object(df[REQUIRED_COLS], index=False)
+    return hashlib.sha1(hashed.to_numpy().tobytes()).hexdigest()
+
+
+# 정규화된 명단 ↔ bytes (세 열을 numpy 문자열 배열로, pickle 없이 읽는다)
+_ARRAY_FIELDS = {"출석 번호": "number", "이름": "name", "성별": "gender"}
+
+
+def roster_to_bytes(df: pd.DataFrame, digest=None, **meta):
+    arrays = {field: np.array(df[col].tolist(), dtype=str) for col, field in _ARRAY_FIELDS.items()}
+    arrays["digest"] = np.array(digest or roster_digest(df))
+    arrays.update({name: np.array(value) for name, value in meta.items()})
+    buf = io.BytesIO()
+    np.savez_compressed(buf, **arrays)
+    return buf.getvalue()
+
+
+def roster_from_bytes(data: bytes):
+    # (DataFrame, roster_digest)
+    with np.load(io.BytesIO(data), allow_pickle=False) as arrays:
+        df = pd.DataFrame({col: arrays[field].tolist() for col, field in _ARRAY_FIELDS.items()})
+        return df, str(arrays["digest"])
+
+
+# 파일 내용 해시 → (정규화된 명단, roster_digest). 다른 세션·재시작 뒤에도 다시 파싱하지 않는다.
+ROSTER_CACHE = register_cache(
+    "roster",
+    TieredCache(
+        "roster",
+        max_entries=64,
+        max_bytes=64 * 1024 * 1024,
+        sizeof=lambda item: int(item[0].memory_usage(deep=True).sum()),
+        encode=lambda item: roster_to_bytes(*item),
+        decode=roster_from_bytes,
+    ),
+)
+
+
+def _parse_roster(data: bytes, file_name: str):
+    df = read_roster_file(data, file_name)
+    return df, roster_digest(df)
+
+
+def cached_roster(state, data: bytes, file_name: str = ""):
+    # state 는 st.session_state 처럼 dict 로 쓸 수 있는 세션 저장소.
+    # 같은 파일이면 위젯을 바꿔서 다시 실행돼도 엑셀을 다시 파싱하지 않는다.
+    digest = file_digest(data)
+    cached = state.get("roster")
+    if cached is None or cached[0] != digest:
+        # 글/엑셀 중 어느 쪽으로 읽는지도 키에 넣는다 (같은 바이트라도 결과가 다를 수 있다)
+        is_text = not _is_xlsx(data) and file_name.lower().endswith(TEXT_SUFFIXES)
+        df, rdigest = ROSTER_CACHE.get_or_create(
+            content_key("roster", digest, is_text), lambda: _parse_roster(data, file_name)
+        )
+        cached = set_roster(state, digest, df, rdigest)
+    return cached[1]
+
+
+def set_roster(state, key: str, df: pd.DataFrame, digest=None):
+    # 이미 정규화된 명단을 현재 명단으로 둔다. key 가 같으면 그대로 둔다.
+    # (저장해 둔 명단을 불러올 때처럼 파싱 없이 바로 쓰는 경우)
+    cached = state.get("roster")
+    if cached is not None and cached[0] == key:
+        return cached
+    if cached is not None:
+        # 바로 전 명단은 남겨 둔다 (전학생 반영처럼 바뀐 부분만 다시 배치할 때 비교용)
+        state["previous_roster"] = cached
+    cached = (key, df, digest or roster_digest(df))
+    state["roster"] = cached
+    return cached
+
+
+def cached_roster_digest(state):
+    # cached_roster 로 읽어 둔 현재 명단의 roster_digest
+    cached = state.get("roster")
+    return cached[2] if cached else None
+
+
+def previous_roster(state):
+    # 바로 전에 올렸던 명단 (DataFrame, roster_digest). 없으면 None
+    cached = state.get("previous_roster")
+    return (cached[1], cached[2]) if cached else None
@@ -0,0 +1,103 @@
+"""선생님별로 정규화된 명단을 서버에 저장해 두고, 다음에 파싱 없이 바로 불러온다.
+
+명단은 정규화(공백 정리, 번호 3.0 → 3, 성별 표기 통일)를 저장할 때 한 번만 하고
+세 열을 numpy 문자열 배열로 압축 저장한다 (.npz, pickle 없이 읽는다).
+폴더 이름은 선생님 이름 + 비밀번호로 만든 해시라서 둘 다 알아야 목록을 볼 수 있다.
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from seating.metrics import timed
+from seating.roster import RosterError, roster_from_bytes, roster_to_bytes
+
+_KEY_SALT = b"seating-roster-store"
+_KEY_ROUNDS = 100_000
+
+
+def default_root():
+    return Path(os.environ.get("SEATING_ROSTER_DIR") or Path.home() / ".seating" / "rosters")
+
+
+def teacher_key(teacher: str, password: str):
+    # 같은 이름 + 비밀번호면 항상 같은 키. 이름만으로는 남의 명단을 찾을 수 없다.
+    teacher, password = teacher.strip(), password.strip()
+    if not teacher or not password:
+        raise RosterError("선생님 이름과 비밀번호를 모두 입력해 주세요.")
+    secret = f"{teacher}\x1f{password}".encode("utf-8")
+    return hashlib.pbkdf2_hmac("sha256", secret, _KEY_SALT, _KEY_ROUNDS).hex()[:32]
+
+
+class RosterStore:
+    def __init__(self, root=None):
+        self.root = Path(root) if root is not None else default_root()
+
+    def _dir(self, key: str):
+        return self.root / key
+
+    def _path(self, key: str, class_name: str):
+        name = hashlib.sha1(class_name.encode("utf-8")).hexdigest()[:16]
+        return self._dir(key) / f"{name}.npz"
+
+    # =========================================================
+    # 1. 저장 / 불러오기
+    # =========================================================
+    @timed("roster_store_save")
+    def save(self, key: str, class_name: str, df: pd.DataFrame):
+        # df 는 normalize_roster 를 거친 명단. 같은 반 이름이면 덮어쓴다.
+        class_name = class_name.strip()
+        if not class_name:
+            raise RosterError("저장할 반 이름을 입력해 주세요.")
+        folder = self._dir(key)
+        folder.mkdir(parents=True, exist_ok=True, mode=0o700)
+
+        data = roster_to_bytes(df, class_name=class_name, saved_at=time.time())
+
+        # 임시 파일에 다 쓴 뒤 이름을 바꿔서, 쓰다 만 파일을 읽는 일이 없게 한다.
+        fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self._path(key, class_name))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @timed("roster_store_load")
+    def load(self, key: str, class_name: str):
+        # (정규화된 명단 DataFrame, roster_digest). 파싱/정규화 없이 배열을 그대로 쓴다.
+        path = self._path(key, class_name)
+        if not path.exists():
+            raise RosterError(f"저장된 '{class_name}' 명단이 없습니다.")
+        return roster_from_bytes(path.read_bytes())
+
+    def delete(self, key: str, class_name: str):
+        self._path(key, class_name).unlink(missing_ok=True)
+
+    # =========================================================
+    # 2. 목록
+    # =========================================================
+    def classes(self, key: str):
+        # [(반 이름, 학생 수, 저장 시각)] — 최근에 저장한 순서
+        folder = self._dir(key)
+        if not folder.is_dir():
+            return []
+        items = []
+        for path in folder.glob("*.npz"):
+            try:
+                with np.load(path, allow_pickle=False) as data:
+                    items.append((str(data["class_name"]), len(data["number"]), float(data["saved_at"])))
+            except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+                continue  # 깨진 파일은 목록에서 뺀다
+        items.sort(key=lambda item: item[2], reverse=True)
+        return items
+
+
+ROSTER_STORE = RosterStore()
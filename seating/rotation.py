@@ -0,0 +1,96 @@
+"""한 학기 자리 바꾸기 계획: 여러 회차 배치를 한 번에 만들고 같은 짝을 최대한 피한다.
+
+회차마다 짝 횟수 행렬(학생×학생)을 갱신하고, 다음 회차는 그 행렬을 비용에 넣은
+국소 탐색(constraints.assign_seats_constrained)으로 만든다.
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from seating.constraints import SeatingConstraints, assign_seats_constrained
+from seating.history import new_seed
+from seating.render.pdf_forms import build_form_pdf_document
+from seating.seatmatrix import EMPTY
+
+
+@dataclass
+class RotationPlan:
+    seating_mode: str
+    bun_dan: int
+    seed: int
+    matrices: list = field(default_factory=list)
+    repeats: list = field(default_factory=list)  # 회차별 "이미 짝이었던" 쌍 수
+    unmet: list = field(default_factory=list)  # 회차별 못 지킨 조건
+    labels: list = field(default_factory=list)
+
+
+# =========================================================
+# 1. 짝 쌍 / 짝 횟수 행렬
+# =========================================================
+def partner_pairs(grid: np.ndarray, seating_mode: str):
+    # 짝 모드는 책상 짝 (0,1), (2,3) ..., 혼자 앉기는 같은 줄 바로 옆자리
+    if seating_mode == "Paired":
+        left, right = grid[:, 0::2], grid[:, 1::2]
+    else:
+        left, right = grid[:, :-1], grid[:, 1:]
+    left, right = left.ravel(), right.ravel()
+    both = (left != EMPTY) & (right != EMPTY)
+    return left[both], right[both]
+
+
+def add_partner_counts(counts: np.ndarray, grid: np.ndarray, seating_mode: str):
+    a, b = partner_pairs(grid, seating_mode)
+    np.add.at(counts, (a, b), 1)
+    np.add.at(counts, (b, a), 1)
+    return counts
+
+
+def count_repeats(counts: np.ndarray, grid: np.ndarray, seating_mode: str):
+    a, b = partner_pairs(grid, seating_mode)
+    return int(np.count_nonzero(counts[a, b]))
+
+
+# =========================================================
+# 2. 계획 세우기
+# =========================================================
+def plan_rotations(
+    df: pd.DataFrame,
+    rows: int,
+    bun_dan: int,
+    seating_mode: str,
+    count: int,
+    constraints: SeatingConstraints | None = None,
+    seed=None,
+    labels=None,
+):
+    if seed is None:
+        seed = new_seed()
+    constraints = constraints or SeatingConstraints()
+    df = df.reset_index(drop=True)
+    n = len(df)
+
+    plan = RotationPlan(seating_mode, bun_dan, seed)
+    plan.labels = list(labels) if labels else [f"{k + 1}회차" for k in range(count)]
+
+    counts = np.zeros((n, n), dtype=np.int32)
+    for k in range(count):
+        matrix, unmet = assign_seats_constrained(
+            df, rows, bun_dan, seating_mode, constraints, seed=seed + k, repeat=counts
+        )
+        plan.repeats.append(count_repeats(counts, matrix.grid, seating_mode))
+        plan.unmet.append(unmet)
+        plan.matrices.append(matrix)
+        add_partner_counts(counts, matrix.grid, seating_mode)
+    return plan
+
+
+def render_plan_pdf(plan: RotationPlan, pages=("teacher", "student")):
+    # 모든 회차를 PDF 한 파일로 (회차마다 교사용/학생용 페이지)
+    names = {"teacher": "교사용", "student": "학생용"}
+    sections = []
+    for label, matrix in zip(plan.labels, plan.matrices):
+        section_pages = [(view, f"{label} {names[view]} 좌석 배치표") for view in pages]
+        sections.append((matrix, plan.seating_mode, plan.bun_dan, section_pages))
+    return build_form_pdf_document(sections)
@@ -0,0 +1,167 @@
+"""학생 번호(인덱스) 격자로 좌석 배치를 담는 가벼운 자료구조.
+
+좌석마다 {"name", "color"} dict 를 복사해 두는 대신, 명단에서 한 번 계산한
+이름/색 목록(SeatTable)을 참조하고 격자에는 그 인덱스만 넣는다 (빈 자리는 -1).
+렌더러가 쓰던 리스트의 리스트처럼 행 단위로 꺼내 쓸 수도 있다.
+"""
+
+import hashlib
+import struct
+
+import numpy as np
+
+EMPTY = -1
+
+_HEADER = struct.Struct("<4sHH")
+_MAGIC = b"SM01"
+
+
+# =========================================================
+# 1. 명단 쪽 표시값 (이름/색)
+# =========================================================
+class SeatTable:
+    def __init__(self, labels, colors):
+        self.labels = list(labels)
+        self.colors = list(colors)
+        self._seats = None
+        self._digest = None
+
+    def __len__(self):
+        return len(self.labels)
+
+    @property
+    def seats(self):
+        # 렌더러용 dict 는 학생마다 한 번만 만들고 모든 배치가 같이 쓴다.
+        if self._seats is None:
+            self._seats = [
+                {"name": name, "color": color}
+                for name, color in zip(self.labels, self.colors)
+            ]
+        return self._seats
+
+    def digest(self):
+        if self._digest is None:
+            h = hashlib.sha1()
+            for name, color in zip(self.labels, self.colors):
+                h.update(name.encode("utf-8"))
+                h.update(b"\x1f")
+                h.update(color.encode("ascii"))
+                h.update(b"\x1e")
+            self._digest = h.hexdigest()
+        return self._digest
+
+
+# =========================================================
+# 2. 좌석 격자
+# =========================================================
+class SeatMatrix:
+    def __init__(self, grid, table: SeatTable):
+        self.grid = np.asarray(grid, dtype=np.int32)
+        if self.grid.ndim != 2:
+            raise ValueError("좌석 격자는 2차원이어야 합니다.")
+        self.table = table
+
+    @classmethod
+    def from_order(cls, order, table: SeatTable, rows: int, cols: int, start_side="left"):
+        # order: 앞줄부터 앉힐 학생 인덱스 순서. 자리보다 많으면 뒤쪽은 잘린다.
+        flat = np.full(rows * cols, EMPTY, dtype=np.int32)
+        order = np.asarray(order, dtype=np.int32)[: rows * cols]
+        flat[: len(order)] = order
+        grid = flat.reshape(rows, cols)
+        if start_side == "right":
+            grid = grid[:, ::-1]  # 오른쪽 -> 왼쪽
+        return cls(grid, table)
+
+    # ---- 크기 / 모양 ----
+    @property
+    def shape(self):
+        return self.grid.shape
+
+    @property
+    def rows(self):
+        return self.grid.shape[0]
+
+    @property
+    def cols(self):
+        return self.grid.shape[1]
+
+    def student_count(self):
+        return int(np.count_nonzero(self.grid != EMPTY))
+
+    # ---- 보기 방향 (복사 없는 뷰) ----
+    def flipped(self):
+        # 앞뒤 뒤집기: 교사용 PDF 처럼 앞줄이 아래로 가는 보기
+        return SeatMatrix(self.grid[::-1], self.table)
+
+    def view(self, view_mode: str):
+        return self.flipped() if view_mode == "teacher" else self
+
+    # ---- 자리 맞바꾸기 ----
+    def swapped(self, swaps):
+        # swaps: [(자리 a, 자리 b), ...] 평평한 자리 번호 (r * cols + c) 쌍을 차례로 맞바꾼 새 배치
+        flat = self.grid.ravel().copy()
+        size = flat.size
+        for a, b in swaps:
+            a, b = int(a), int(b)
+            if not (0 <= a < size and 0 <= b < size):
+                raise ValueError(f"자리 번호가 범위를 벗어났습니다: {a}, {b}")
+            flat[a], flat[b] = flat[b], flat[a]
+        return SeatMatrix(flat.reshape(self.shape), self.table)
+
+    # ---- 리스트의 리스트처럼 쓰기 ----
+    def seat(self, r: int, c: int):
+        idx = int(self.grid[r, c])
+        return None if idx == EMPTY else self.table.seats[idx]
+
+    def row(self, r: int):
+        seats = self.table.seats
+        return [None if idx == EMPTY else seats[idx] for idx in self.grid[r].tolist()]
+
+    def __len__(self):
+        return self.rows
+
+    def __iter__(self):
+        for r in range(self.rows):
+            yield self.row(r)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return SeatMatrix(self.grid[key], self.table)
+        return self.row(key)
+
+    def to_list(self):
+        return list(self)
+
+    # ---- 직렬화 / 비교 ----
+    def to_bytes(self):
+        # 격자만 담는다 (명단 쪽 SeatTable 은 따로 보관/복원).
+        return _HEADER.pack(_MAGIC, self.rows, self.cols) + np.ascontiguousarray(
+            self.grid, dtype="<i4"
+        ).tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes, table: SeatTable):
+        magic, rows, cols = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError("SeatMatrix 데이터가 아닙니다.")
+        grid = np.frombuffer(data, dtype="<i4", offset=_HEADER.size).reshape(rows, cols)
+        return cls(grid, table)
+
+    def digest(self):
+        h = hashlib.sha1(self.table.digest().encode("ascii"))
+        h.update(self.to_bytes())
+        return h.hexdigest()
+
+    def __eq__(self, other):
+        if not isinstance(other, SeatMatrix):
+            return NotImplemented
+        return (
+            self.shape == other.shape
+            and np.array_equal(self.grid, other.grid)
+            and (self.table is other.table or self.table.digest() == other.table.digest())
+        )
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"SeatMatrix(rows={self.rows}, cols={self.cols}, students={self.student_count()})"
@@ -0,0 +1,368 @@
+"""두 페이지가 함께 쓰는 Streamlit 화면 조각 (streamlit 은 이 모듈에서만 import)."""
+
+import hashlib
+import os
+import time
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from seating.cache import content_key, deferred, new_session_pdf_cache
+from seating.fonts import load_korean_font
+from seating.incremental import apply_roster_diff, diff_rosters
+from seating.jobs import find_pdf, progress, submit_pdf
+from seating.metrics import maybe_start_metrics_server
+from seating.render.base import STUDENT_TITLE, TEACHER_TITLE
+from seating.render.html import FRONT_OF_CLASS_HTML, HTML_STYLE, render_chart
+from seating.render.pdf import reuse_pdf_pages
+from seating.render.png import make_png_pages
+from seating.render.print_html import make_print_html_pages
+from seating.render.svg import make_svg_pages
+from seating.roster import RosterError, cached_roster, set_roster
+from seating.roster_store import ROSTER_STORE, teacher_key
+
+# SEATING_METRICS_PORT 가 있으면 /metrics (Prometheus) 를 프로세스당 한 번 연다.
+maybe_start_metrics_server()
+
+
+# =========================================================
+# 1. 화면용 좌석표
+# =========================================================
+def show_chart(matrix, seating_mode="Single"):
+    st.markdown(FRONT_OF_CLASS_HTML, unsafe_allow_html=True)
+    st.markdown(render_chart(matrix, seating_mode), unsafe_allow_html=True)
+
+
+# =========================================================
+# 2. 다운로드 버튼 (PDF 3종 + 프로젝터/인쇄용)
+# =========================================================
+def pdf_download_section(
+    matrix,
+    seating_mode,
+    bun_dan,
+    file_prefix,
+    teacher_title=TEACHER_TITLE,
+    student_title=STUDENT_TITLE,
+):
+    font = load_korean_font()
+    if font.is_fallback:
+        st.warning("⚠️ 한글 폰트를 불러오지 못해 PDF의 한글이 깨질 수 있습니다.")
+    st.caption(f"PDF 글꼴: {font.describe()}")
+
+    # PDF 는 "만들기" 를 누른 것만 백그라운드 작업으로 넣는다 (화면만 보는 경우가 대부분이다).
+    # 다른 세션이 이미 만든 같은 PDF 는 누르지 않아도 바로 다운로드 버튼이 나온다.
+    layout = (matrix, seating_mode, bun_dan)
+    specs = [
+        ("📥 교사용 PDF", f"{file_prefix}_teacher.pdf", [("teacher", teacher_title)]),
+        ("📥 학생용 PDF", f"{file_prefix}_student.pdf", [("student", student_title)]),
+        (
+            "📥 교사+학생 한 번에",
+            f"{file_prefix}_both.pdf",
+            [("teacher", teacher_title), ("student", student_title)],
+        ),
+    ]
+    _pdf_job_buttons(layout, specs)
+
+    # 나머지 형식은 다운로드 버튼을 눌렀을 때만 만들고, 세션별 캐시에 보관한다.
+    if "pdf_cache" not in st.session_state:
+        st.session_state["pdf_cache"] = new_session_pdf_cache()
+    pdf_cache = st.session_state["pdf_cache"]
+    layout_key = content_key(matrix, seating_mode, bun_dan, teacher_title, student_title)
+
+    # 프로젝터로 띄우거나 브라우저에서 바로 인쇄할 때는 폰트를 넣지 않는 형식이 훨씬 가볍다.
+    student_page = [("student", student_title)]
+    svg = deferred(
+        pdf_cache,
+        ("svg", layout_key),
+        lambda: make_svg_pages(matrix, seating_mode, bun_dan, student_page),
+    )
+    png = deferred(
+        pdf_cache,
+        ("png", layout_key),
+        lambda: make_png_pages(matrix, seating_mode, bun_dan, student_page),
+    )
+    print_html = deferred(
+        pdf_cache,
+        ("print-html", layout_key),
+        lambda: make_print_html_pages(
+            matrix, seating_mode, bun_dan, [("teacher", teacher_title), ("student", student_title)]
+        ),
+    )
+
+    with st.expander("🖥️ 프로젝터 / 인쇄용 (SVG · PNG · HTML)"):
+        e1, e2, e3 = st.columns(3)
+        with e1:
+            st.download_button(
+                "📥 학생용 SVG",
+                svg,
+                file_name=f"{file_prefix}_student.svg",
+                mime="image/svg+xml",
+                on_click="ignore",
+            )
+        with e2:
+            st.download_button(
+                "📥 학생용 PNG",
+                png,
+                file_name=f"{file_prefix}_student.png",
+                mime="image/png",
+                on_click="ignore",
+            )
+        with e3:
+            st.download_button(
+                "📥 인쇄용 HTML (교사+학생)",
+                print_html,
+                file_name=f"{file_prefix}_print.html",
+                mime="text/html",
+                on_click="ignore",
+            )
+
+
+JOB_POLL_SECONDS = 0.5
+
+
+def _find_jobs(layout, specs):
+    return [find_pdf(*layout, pages, label) for label, _, pages in specs]
+
+
+def _pdf_job_buttons(layout, specs):
+    # specs: [(버튼 이름, 파일 이름, 페이지 구성), ...]
+    # 만드는 중인 PDF 가 있으면 이 조각만 주기적으로 다시 그리고, 아니면 그냥 그린다.
+    jobs = _find_jobs(layout, specs)
+    if all(job is None or job.done for job in jobs):
+        _job_buttons(layout, specs, jobs)
+    else:
+        _pending_job_buttons(layout, specs)
+
+
+@st.fragment(run_every=JOB_POLL_SECONDS)
+def _pending_job_buttons(layout, specs):
+    # 조각이 다시 실행될 때마다 작업을 새로 찾는다 (그 사이에 "만들기" 를 누른 것도 보인다).
+    jobs = _find_jobs(layout, specs)
+    done, total = progress(job for job in jobs if job is not None)
+    if done < total:
+        st.progress(done / total, text=f"PDF 만드는 중... ({done}/{total})")
+    _job_buttons(layout, specs, jobs)
+    if done == total:
+        # 다 끝나면 전체를 한 번 다시 그린다. 그때는 만드는 중인 작업이 없어서 이 조각을 쓰지 않으므로
+        # 주기적 갱신도 멈춘다.
+        st.rerun()
+
+
+def _job_buttons(layout, specs, jobs):
+    # 요청 전이면 "만들기", 만드는 중이면 비활성 버튼, 끝났으면 다운로드 버튼, 실패했으면 오류와 "다시 만들기"
+    for col, (label, file_name, pages), job in zip(st.columns(len(specs)), specs, jobs):
+        with col:
+            if job is None:
+                st.button(
+                    f"🛠️ {label.removeprefix('📥 ')} 만들기",
+                    key=f"{file_name}_make",
+                    on_click=submit_pdf,
+                    args=(*layout, pages, label),
+                )
+            elif not job.done:
+                st.button(f"{label} (만드는 중…)", disabled=True, key=f"{file_name}_pending")
+            elif job.error is not None:
+                st.error(f"⚠️ PDF를 만들지 못했습니다: {job.error}")
+                st.button(
+                    "🔁 다시 만들기",
+                    key=f"{file_name}_retry",
+                    on_click=submit_pdf,
+                    args=(*layout, pages, label),
+                )
+            else:
+                st.download_button(
+                    label,
+                    job.result(),
+                    file_name=file_name,
+                    mime="application/pdf",
+                    on_click="ignore",
+                )
+
+
+# =========================================================
+# 3. 명단이 조금 바뀌었을 때 (바뀐 학생 자리만 반영)
+# =========================================================
+def roster_update_section(
+    old_df,
+    new_df,
+    old_matrix,
+    seating_mode,
+    bun_dan,
+    engine="random",
+    start_side="left",
+    teacher_title=TEACHER_TITLE,
+    student_title=STUDENT_TITLE,
+):
+    # 이전 명단으로 만든 배치가 있을 때 바뀐 학생을 안내하고,
+    # 버튼을 누르면 바뀐 자리만 고친 새 SeatMatrix 를 돌려준다. (아니면 None)
+    try:
+        diff = diff_rosters(old_df, new_df)
+    except RosterError as e:
+        st.info(f"이전 배치에 바로 반영할 수 없습니다: {e}")
+        return None
+    if diff.is_empty():
+        return None
+
+    st.info(
+        f"🔁 이전 명단과 비교: {diff.summary()}\n\n"
+        "새로 배치하지 않고 바뀐 학생 자리만 고칠 수 있습니다. (나머지 학생은 그대로)"
+    )
+    if not st.button("🔁 바뀐 학생 자리만 반영"):
+        return None
+
+    try:
+        matrix, seats = apply_roster_diff(old_matrix, new_df, diff, engine, start_side)
+    except RosterError as e:
+        st.error(f"⚠️ {e}")
+        return None
+
+    # 이전 배치의 PDF 페이지가 캐시에 있으면 바뀐 칸만 다시 그린다.
+    pages = [("teacher", teacher_title), ("student", student_title)]
+    reuse_pdf_pages(old_matrix, matrix, seating_mode, bun_dan, pages, seats)
+    return matrix
+
+
+# =========================================================
+# 4. 자리 직접 바꾸기 (브라우저 안에서 바꾸고 한 번에 적용)
+# =========================================================
+_SWAP_EDITOR = components.declare_component(
+    "seat_swap_editor",
+    path=os.path.join(os.path.dirname(__file__), "components", "swap_editor"),
+)
+
+
+def swap_editor_section(matrix, seating_mode="Single", key="swap_editor"):
+    # 끌어다 놓거나 두 자리를 차례로 눌러 바꾸는 동안에는 서버로 아무것도 보내지 않는다.
+    # "적용" 을 누르면 바꾼 목록이 한 번에 돌아오고, 바뀐 새 SeatMatrix 를 돌려준다. (아니면 None)
+    st.markdown(FRONT_OF_CLASS_HTML, unsafe_allow_html=True)
+    value = _SWAP_EDITOR(
+        html=render_chart(matrix, seating_mode),
+        style=HTML_STYLE,
+        key=key,
+        default=None,
+    )
+
+    # 컴포넌트 값은 다음 실행에도 그대로 남아 있으므로, 같은 목록은 한 번만 적용한다.
+    if not value or value.get("nonce") == st.session_state.get(f"{key}_applied"):
+        return None
+    st.session_state[f"{key}_applied"] = value.get("nonce")
+    try:
+        return matrix.swapped(value.get("swaps", []))
+    except (TypeError, ValueError) as e:
+        st.error(f"⚠️ 자리 바꾸기를 적용하지 못했습니다: {e}")
+        return None
+
+
+# =========================================================
+# 5. 명단 입력 (파일 / 붙여넣기 / 저장해 둔 명단)
+# =========================================================
+ROSTER_FILE_TYPES = ["xlsx", "csv", "tsv", "txt"]
+_PASTE_FILE_NAME = "붙여넣기.tsv"
+_STORED_PREFIX = "store:"
+
+
+def roster_input_section(key="roster"):
+    # 파일 → 붙여넣은 글 → 저장해 둔 명단 순서로 현재 명단을 정한다.
+    # 정규화된 명단 DataFrame 을 돌려주고, 아직 명단이 없으면 None.
+    uploaded_file = st.file_uploader(
+        "명단 파일 업로드 (.xlsx / .csv / .tsv)", type=ROSTER_FILE_TYPES, key=f"{key}_file"
+    )
+    with st.expander("📋 스프레드시트에서 복사해 붙여넣기"):
+        st.caption("엑셀·구글 시트에서 `출석 번호 | 이름 | 성별` 칸을 머리글과 함께 복사해 붙여 넣으세요.")
+        pasted = st.text_area("명단 붙여넣기", key=f"{key}_paste", label_visibility="collapsed")
+
+    df = None
+    try:
+        if uploaded_file is not None:
+            # 같은 파일이면 세션에 보관된 정규화 명단을 그대로 쓴다 (재파싱 없음)
+            df = cached_roster(st.session_state, uploaded_file.getvalue(), uploaded_file.name)
+        elif pasted.strip():
+            df = cached_roster(st.session_state, pasted.encode("utf-8"), _PASTE_FILE_NAME)
+    except RosterError as e:
+        st.error(f"❌ {e}")
+    except Exception as e:
+        st.error(f"명단을 읽는 중 오류가 발생했습니다: {e}")
+
+    with st.expander("💾 저장해 둔 명단 (선생님별)"):
+        stored = _roster_store_section(df, key, can_load=uploaded_file is None and not pasted.strip())
+
+    if df is None and uploaded_file is None and not pasted.strip():
+        df = stored
+    return df
+
+
+def _store_key(teacher, password):
+    # 비밀번호 해시(pbkdf2)는 느리게 만들어 둔 것이라 같은 입력이면 세션에서 다시 쓴다.
+    login = hashlib.sha256(f"{teacher}\x1f{password}".encode("utf-8")).hexdigest()
+    cached = st.session_state.get("roster_store_login")
+    if cached is None or cached[0] != login:
+        cached = (login, teacher_key(teacher, password))
+        st.session_state["roster_store_login"] = cached
+    return cached[1]
+
+
+def _roster_store_section(df, key, can_load=True):
+    # 저장: 지금 명단(정규화된 것)을 반 이름으로 저장한다.
+    # 불러오기: 파싱 없이 배열을 읽어 현재 명단으로 둔다. 불러온 명단(없으면 None)을 돌려준다.
+    cached = st.session_state.get("roster")
+    current = cached[1] if cached and str(cached[0]).startswith(_STORED_PREFIX) else None
+
+    st.caption("이름과 비밀번호가 모두 같아야 같은 보관함이 열립니다. 명단은 이 서버에만 저장됩니다.")
+    col1, col2 = st.columns(2)
+    with col1:
+        teacher = st.text_input("선생님 이름", key=f"{key}_teacher")
+    with col2:
+        password = st.text_input("보관함 비밀번호", type="password", key=f"{key}_password")
+    if not teacher.strip() or not password.strip():
+        return current
+    store_key = _store_key(teacher, password)
+
+    if df is not None:
+        col1, col2 = st.columns([3, 1], vertical_alignment="bottom")
+        with col1:
+            class_name = st.text_input("저장할 반 이름", placeholder="예: 2학년 3반", key=f"{key}_class")
+        with col2:
+            if st.button("💾 저장", key=f"{key}_save"):
+                try:
+                    ROSTER_STORE.save(store_key, class_name, df)
+                except RosterError as e:
+                    st.error(f"❌ {e}")
+                else:
+                    st.success(f"'{class_name.strip()}' 명단을 저장했습니다.")
+
+    classes = ROSTER_STORE.classes(store_key)
+    if not classes:
+        st.info("저장해 둔 명단이 없습니다.")
+        return current
+
+    col1, col2, col3 = st.columns([3, 1, 1], vertical_alignment="bottom")
+    with col1:
+        picked = st.selectbox(
+            "저장해 둔 반",
+            range(len(classes)),
+            format_func=lambda i: f"{classes[i][0]} ({classes[i][1]}명, "
+            f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(classes[i][2]))})",
+            key=f"{key}_stored",
+        )
+    class_name = classes[picked][0]
+    with col2:
+        load = st.button(
+            "📂 불러오기",
+            key=f"{key}_load",
+            disabled=not can_load,
+            help=None if can_load else "올린 파일이나 붙여넣은 명단을 지우면 불러올 수 있습니다.",
+        )
+    with col3:
+        if st.button("🗑️ 삭제", key=f"{key}_delete"):
+            ROSTER_STORE.delete(store_key, class_name)
+            st.rerun()
+
+    if load:
+        try:
+            loaded, digest = ROSTER_STORE.load(store_key, class_name)
+        except RosterError as e:
+            st.error(f"❌ {e}")
+        else:
+            set_roster(st.session_state, _STORED_PREFIX + digest, loaded, digest)
+            current = loaded
+    return current